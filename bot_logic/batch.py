@@ -0,0 +1,173 @@
+"""
+Module with the batched evaluation, which calculates the static heuristics of many positions at once with NumPy.
+
+The positions are stacked into a single array with one row per position and one column per field (1 for a black piece,
+-1 for a white piece and 0 for an empty field), so every term of heuristics_score becomes a few array operations over
+all positions together. NumPy is optional; without it, the search evaluates the positions one by one.
+"""
+
+from bot_logic.heuristics import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    WEIGHT_VECTOR = np.array(bitboard.WEIGHTS, dtype=np.float64)
+    NEIGHBOUR_MATRIX = np.array([[neighbours >> square & 1 for square in range(ROWS * COLUMNS)]
+                                 for neighbours in bitboard.NEIGHBOURS], dtype=np.int64)
+    CORNER_SQUARES = np.array([corner.bit_length() - 1 for corner in CORNERS])
+    NEAR_CORNER_MATRIX = np.array([[near_corner >> square & 1 for square in range(ROWS * COLUMNS)]
+                                   for near_corner in NEAR_CORNERS], dtype=np.int64)
+
+
+def stack_bitboards(blacks, whites):
+    """
+    Function that stacks positions given by their bitboards into one array.
+
+    :param blacks: Bitboards of the black pieces.
+    :type blacks: list[int]
+    :param whites: Bitboards of the white pieces.
+    :type whites: list[int]
+
+    :return: Array of shape (number of positions, 64) with 1 for black, -1 for white and 0 for empty fields.
+    :rtype: numpy.ndarray
+    """
+
+    bits = np.array([blacks, whites], dtype='<u8').T.copy()
+    fields = np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little').reshape(len(blacks), 2, ROWS * COLUMNS)
+    return fields[:, 0].astype(np.int64) - fields[:, 1].astype(np.int64)
+
+
+def stack_boards(boards):
+    """
+    Function that stacks boards into one array.
+
+    :param boards: Boards.
+    :type boards: list[game_structures.Board.Board]
+
+    :return: Array of shape (number of boards, 64) with 1 for black, -1 for white and 0 for empty fields.
+    :rtype: numpy.ndarray
+    """
+
+    return stack_bitboards([board.black_bits for board in boards], [board.white_bits for board in boards])
+
+
+def _ratio_score(this, other, positive, negative):
+    """
+    Helper function for the share of one player in a term, vectorized the same way as in the scalar heuristics: the
+    positive branch is used where this > other, the negative one where this < other, and 0 where they are equal.
+
+    :param this: Term of the player making the move.
+    :type this: numpy.ndarray
+    :param other: Term of the other player.
+    :type other: numpy.ndarray
+    :param positive: Value used where this > other.
+    :type positive: numpy.ndarray
+    :param negative: Value used where this < other.
+    :type negative: numpy.ndarray
+
+    :return: Score of the term.
+    :rtype: numpy.ndarray
+    """
+
+    return np.where(this > other, positive, np.where(this < other, negative, 0.0))
+
+
+def batch_heuristics_score(fields, color):
+    """
+    Function for calculating heuristics_score of all stacked positions at once.
+
+    :param fields: Stacked positions.
+    :type fields: numpy.ndarray
+    :param color: Player making the move.
+    :type color: tuple[int, int, int]
+
+    :return: Heuristic value of every position.
+    :rtype: numpy.ndarray
+    """
+
+    if color == WHITE:
+        fields = -fields
+    this = fields == 1
+    other = fields == -1
+    empty_neighbours = (fields == 0).astype(np.int64) @ NEIGHBOUR_MATRIX
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        board_score = fields @ WEIGHT_VECTOR
+        this_front = (empty_neighbours * this).sum(axis=1)
+        other_front = (empty_neighbours * other).sum(axis=1)
+        front_score = _ratio_score(this_front, other_front, -(100.0 * this_front) / (this_front + other_front),
+                                   (100.0 * other_front) / (this_front + other_front))
+        board_total_score = board_score * 5 + front_score * 74.396
+
+        this_pieces = this.sum(axis=1)
+        other_pieces = other.sum(axis=1)
+        pieces_score = _ratio_score(this_pieces, other_pieces, (100.0 * this_pieces) / (this_pieces + other_pieces),
+                                    -(100.0 * other_pieces) / (this_pieces + other_pieces)) * 500
+
+    corners = fields[:, CORNER_SQUARES]
+    corners_score = corners.sum(axis=1)
+    near_corner_score = ((fields @ NEAR_CORNER_MATRIX.T) * (corners == 0)).sum(axis=1)
+    corners_total_score = corners_score * (801.724 * 25) + near_corner_score * (-12.5 * 382.026)
+
+    return board_total_score + pieces_score + corners_total_score
+
+
+def batch_mobility_heuristics(this_legal, other_legal):
+    """
+    Function for calculating mobility_heuristics of many positions at once.
+
+    :param this_legal: Number of legal moves for the player making the move in every position.
+    :type this_legal: numpy.ndarray
+    :param other_legal: Number of legal moves for the other player in every position.
+    :type other_legal: numpy.ndarray
+
+    :return: Heuristic value of every position.
+    :rtype: numpy.ndarray
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = (100.0 * this_legal) / (this_legal + other_legal)
+        return _ratio_score(this_legal, other_legal, ratio, -ratio) * 78.922
+
+
+def evaluate_children(state, moves, context):
+    """
+    Function that evaluates all positions reached by one move from the current state in a single batch, the same way
+    the search evaluates a leaf position.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param moves: Moves to evaluate.
+    :type moves: list
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+
+    :return: Heuristic value of every child from the point of view of the player on the move in the child.
+    :rtype: list[float]
+
+    :raises SearchTimeout: If the deadline of the search has passed.
+    """
+
+    player = state.playing
+    color = BLACK if player == WHITE else WHITE
+    blacks = []
+    whites = []
+    this_legal = []
+    other_legal = []
+    for row, column in moves:
+        context.visit()
+        record = state.make_move(row, column, player)
+        try:
+            blacks.append(state.black_bits)
+            whites.append(state.white_bits)
+            this, other = state.mobility()
+            this_legal.append(this)
+            other_legal.append(other)
+        finally:
+            state.unmake_move(record)
+    values = batch_heuristics_score(stack_bitboards(blacks, whites), color)
+    values += batch_mobility_heuristics(np.array(this_legal), np.array(other_legal))
+    return values.tolist()
@@ -2,184 +2,130 @@
 Module containing basic functions related to the bot_logic of the game.
 """
 
-from bot_logic.heuristics import *
-from data_structures.GameTree import *
-from math import inf
-from copy import deepcopy
-from time import time
+from bot_logic.search import *
+from bot_logic.parallel import *
+from bot_logic.lazy_smp import *
+from bot_logic.endgame import *
+from bot_logic.opening_book import *
 
+MINIMAX = "minimax"
+NEGAMAX = "negamax"
+ROOT_SPLIT = "root_split"
+LAZY_SMP = "lazy_smp"
 
-def bot_play(board, hash_map, current_node):
+
+def bot_play(board, hash_map, current_node, time_limit=TIME_LIMIT, algorithm=NEGAMAX, endgame_empties=ENDGAME_EMPTIES,
+             evaluation_cache=None, workers=WORKERS, parallel=PARALLEL, stop=None):
     """
     Main function for the bot_logic to make a move, i.e., for the white player.
+    Positions from the opening book are played from the book without any search. Otherwise, the best move is searched
+    with iterative deepening: the depth is increased by one until the time limit runs out, and the move of the last
+    completed search is played. Once there are few enough empty fields, the game is solved exactly until its end
+    instead: first for the outcome (win, loss or draw), with ENDGAME_SHARE of the time limit, and then for the exact
+    final score with the rest of it. If the outcome is not found in time, the remaining time goes to iterative
+    deepening as usual. If the white player has no legal moves, no move is returned.
 
     :param board: Current state of the board.
     :type board: game_structures.Board.Board
-    :param hash_map: Hash map.
-    :type hash_map: data_structures.HashMap.HashMap
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
     :param current_node: Current node of the tree.
     :type current_node: data_structures.GameTree.TreeNode
+    :param time_limit: Time in seconds available for the move.
+    :type time_limit: float
+    :param algorithm: Search algorithm, MINIMAX or NEGAMAX (negamax with principal variation search).
+    :type algorithm: str
+    :param endgame_empties: Number of empty fields at which the exact endgame solver takes over.
+    :type endgame_empties: int
+    :param evaluation_cache: Cache of leaf evaluations to reuse between moves; a new one is used for every move if it
+                             is not given.
+    :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+    :param workers: Number of processes searching in parallel; 1 searches in this process only.
+    :type workers: int
+    :param parallel: Parallel strategy of negamax: ROOT_SPLIT (the root moves are split between the processes) or
+                     LAZY_SMP (all processes search the whole tree and share one search table, which then replaces
+                     hash_map).
+    :type parallel: str
+    :param stop: Flag that cancels the search once its value is set; the best move found so far is returned.
+    :type stop: ctypes.c_byte or NoneType
 
     :return: Row and column of the field where the move will be played and the depth at which the search for the best move is executed.
-    :rtype: tuple[int, int, int]
+             Row and column are None if there are no legal moves.
+    :rtype: tuple[int, int, int] or tuple[NoneType, NoneType, int]
     """
 
-    elapsed_time = 0
-    depth = variable_depth(board, elapsed_time)
-    row, col = minimax(board, depth, hash_map, current_node, elapsed_time)[1]
+    if len(board.legal_moves) == 0:
+        return None, None, 0
+    book_entry = book_move(board)
+    if book_entry is not None:
+        return book_entry
+
+    context = SearchContext(time_limit, evaluation_cache=evaluation_cache, stop=stop)
+    if isinstance(hash_map, TranspositionTable):
+        hash_map.new_search()
+    empty_fields = ROWS * COLUMNS - board.black - board.white
+    if empty_fields <= endgame_empties:
+        try:
+            solver_context = SearchContext(time_limit * ENDGAME_SHARE, evaluation_cache=evaluation_cache, stop=stop)
+            outcome, best_move = solve_endgame(board, solver_context, WIN_LOSS_DRAW)
+            depth = empty_fields
+        except SearchTimeout:
+            best_move, depth = iterative_deepening(board, hash_map, current_node, context, algorithm, empty_fields,
+                                                   workers, parallel)
+        else:
+            if outcome != 0:
+                try:
+                    best_move = solve_endgame(board, context, EXACT_SCORE, outcome)[1]
+                except SearchTimeout:
+                    pass
+    else:
+        best_move, depth = iterative_deepening(board, hash_map, current_node, context, algorithm, empty_fields,
+                                               workers, parallel)
+    row, col = best_move
 
     return row, col, depth
 
 
-def variable_depth(state, elapsed_time):
-    """
-    Helper function that evaluates the depth relative to the current state for the minimax algorithm.
-
-    :param state: Current state of the board.
-    :type state: game_structures.Board.Board
-    :param elapsed_time: Elapsed time since the start of the move.
-    :type elapsed_time: float
-
-    :return: Depth.
-    :rtype: int
+def iterative_deepening(board, hash_map, current_node, context, algorithm, max_depth, workers=1, parallel=ROOT_SPLIT):
     """
+    Helper function that repeats the search with the depth increased by one, until the deadline of the search or the
+    maximum depth is reached.
 
-    legal_possibilites = len(state.legal_moves)
-    if elapsed_time > 2.5:
-        return 1
-    if legal_possibilites > 8:
-        return 3
-    elif legal_possibilites > 5:
-        return 4
-    else:
-        return 5
-
-
-def minimax(state, depth, hash_map, current_node, elapsed_time, player=WHITE, alpha=-float(inf), beta=float(inf)):
-    """
-    Minimax algorithm with alpha-beta pruning.
-    bot_logic is the white player, so in this case, the white player is the Maximizer, and the black player is the Minimizer.
-
-    :param state: Current state of the board.
-    :type state: game_structures.Board.Board
-    :param depth: Depth.
-    :type depth: int
-    :param hash_map: Hash map.
-    :type hash_map: data_structures.HashMap.HashMap
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
     :param current_node: Current node of the tree.
     :type current_node: data_structures.GameTree.TreeNode
-    :param elapsed_time: Elapsed time since the start of the move.
-    :type elapsed_time: float
-    :param player: Player making the move.
-    :type player: tuple[int, int, int]
-    :param alpha: The minimum value that can be achieved.
-    :type alpha: float
-    :param beta: The maximum value that can be achieved.
-    :type beta: float
-
-    :return: Heuristic value, best move, number of possible moves.
-    :rtype: tuple[int, tuple[int, int], int]
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param algorithm: Search algorithm, MINIMAX or NEGAMAX.
+    :type algorithm: str
+    :param max_depth: Maximum depth.
+    :type max_depth: int
+    :param workers: Number of processes searching negamax in parallel.
+    :type workers: int
+    :param parallel: Parallel strategy, ROOT_SPLIT or LAZY_SMP.
+    :type parallel: str
+
+    :return: Best move of the last completed search and its depth.
+    :rtype: tuple[tuple[int, int], int]
     """
 
-    if depth == 0 or len(state.legal_moves) == 0:
-        start = time()
-        future_legal_moves = 0
-        if len(state.legal_moves) != 0:
-            for legal_row, legal_column in state.legal_moves:
-                tmp_board = deepcopy(state)
-                color = WHITE
-                if tmp_board.playing == WHITE:
-                    color = BLACK
-                tmp_board.insert(legal_row, legal_column, color)
-                future_legal_moves = max(future_legal_moves, len(tmp_board.legal_moves))
-        try:
-            value = hash_map[state.state][0]
-        except KeyError:
-            value = calculate_heuristics(state)
-            value += mobility_heuristics(len(state.legal_moves), future_legal_moves)
-            hash_map[state.state] = value, state, future_legal_moves
-        elapsed_time += time() - start
-        return value, (None, None), future_legal_moves, elapsed_time
+    if algorithm == NEGAMAX and workers > 1 and parallel == LAZY_SMP:
+        return lazy_smp(board, current_node, context, max_depth, workers)
 
-    if player == WHITE:
-        value = -100000000
-        best_move = None
-        now_legal_moves = 0
-        for legal_row, legal_column in state.legal_moves:
-            if elapsed_time > 2.5:
-                break
-            tmp_board = deepcopy(state)
-            tmp_board.insert(legal_row, legal_column, WHITE)
-            tmp_legal_moves = len(tmp_board.legal_moves)
-            for current_child in current_node.children:
-                if tmp_board == current_child.data:
-                    new_node = current_child
-                    break
-            else:
-                new_node = TreeNode(deepcopy(tmp_board))
-                current_node.add_child(new_node)
-            if (legal_row, legal_column) in [(0, 0), (0, 7), (7, 0), (7, 7)]:
-                best_move = (legal_row, legal_column)
-                break
-            new_depth = variable_depth(tmp_board, elapsed_time)
-            if new_depth <= depth:
-                depth = new_depth
-            try:
-                new_value, new_state, future_legal_moves = hash_map[tmp_board.state]
-            except KeyError:
-                start = time()
-                new_value, last_move, future_legal_moves = minimax(tmp_board, depth - 1, hash_map, new_node, elapsed_time, BLACK, alpha, beta)[0:3]
-                hash_map[tmp_board.state] = new_value, last_move, future_legal_moves
-                elapsed_time += time() - start
-            value = max(value, new_value)
-            alpha = max(alpha, value)
-            if value == new_value:
-                best_move = (legal_row, legal_column)
-                now_legal_moves = tmp_legal_moves
-            if elapsed_time > 2.5:
-                break
-            if beta <= alpha:
-                break
-        if best_move is None:
-            best_move = state.legal_moves[0]
-        return value, best_move, now_legal_moves, elapsed_time
-
-    else:
-        value = 100000000
-        best_move = None
-        now_legal_moves = 0
-        for legal_row, legal_column in state.legal_moves:
-            if elapsed_time > 2.5:
-                break
-            tmp_board = deepcopy(state)
-            tmp_board.insert(legal_row, legal_column, BLACK)
-            tmp_legal_moves = len(tmp_board.legal_moves)
-            for current_child in current_node.children:
-                if tmp_board == current_child.data:
-                    new_node = current_child
-                    break
+    best_move = board.legal_moves[0]
+    depth = 0
+    for search_depth in range(1, max_depth + 1):
+        try:
+            if algorithm == MINIMAX:
+                best_move = minimax(board, search_depth, hash_map, current_node, context, board.playing)[1]
+            elif workers > 1:
+                best_move = parallel_negamax(board, search_depth, hash_map, context, workers)[1]
             else:
-                new_node = TreeNode(deepcopy(tmp_board))
-                current_node.add_child(new_node)
-            new_depth = variable_depth(tmp_board, elapsed_time)
-            if new_depth < depth - 1:
-                depth = new_depth
-            try:
-                new_value, new_state, future_legal_moves = hash_map[tmp_board.state]
-            except KeyError:
-                start = time()
-                new_value, last_move, future_legal_moves = minimax(tmp_board, depth - 1, hash_map, new_node, elapsed_time, WHITE, alpha, beta)[0:3]
-                hash_map[tmp_board.state] = new_value, last_move, future_legal_moves
-                elapsed_time += time() - start
-            value = min(value, new_value)
-            beta = min(beta, value)
-            if value == new_value:
-                best_move = (legal_row, legal_column)
-                now_legal_moves = tmp_legal_moves
-            if elapsed_time > 2.5:
-                break
-            if beta <= alpha:
-                break
-        if best_move is None:
-            best_move = state.legal_moves[0]
-        return value, best_move, now_legal_moves, elapsed_time
+                best_move = negamax(board, search_depth, hash_map, current_node, context)[1]
+        except SearchTimeout:
+            break
+        depth = search_depth
+    return best_move, depth
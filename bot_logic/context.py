@@ -0,0 +1,90 @@
+"""
+Module with the SearchContext class, shared by all nodes of a single search.
+"""
+
+from bot_logic.ordering import *
+from data_structures.EvaluationCache import *
+from time import time
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchContext(object):
+    """
+    Class SearchContext models the state shared by all the nodes of one search, such as its deadline, move ordering and
+    the cache of leaf evaluations.
+    """
+
+    def __init__(self, time_limit=TIME_LIMIT, batch_evaluation=BATCH_EVALUATION, evaluation_cache=None, stop=None):
+        """
+        Constructor of the SearchContext class.
+
+        :param time_limit: Time in seconds available for the search.
+        :type time_limit: float
+        :param batch_evaluation: Whether the children of the nodes at depth 1 are evaluated in one batch with NumPy.
+        :type batch_evaluation: bool
+        :param evaluation_cache: Cache of leaf evaluations; a new one is created if it is not given, and a given one is
+                                 emptied if it was filled by another evaluation.
+        :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+        :param stop: Flag shared between processes (e.g. multiprocessing.RawValue) that stops the search once its value
+                     is set.
+        :type stop: ctypes.c_byte or NoneType
+        """
+
+        self._start = time()
+        self._deadline = self._start + time_limit
+        self._nodes = 0
+        self._ordering = MoveOrdering()
+        self._batch_evaluation = batch_evaluation
+        if evaluation_cache is None:
+            evaluation_cache = EvaluationCache()
+        evaluation_cache.check_fingerprint(evaluator_fingerprint())
+        self._evaluation_cache = evaluation_cache
+        self._stop = stop
+
+    @property
+    def deadline(self):
+        return self._deadline
+
+    @property
+    def ordering(self):
+        return self._ordering
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @property
+    def batch_evaluation(self):
+        return self._batch_evaluation
+
+    @property
+    def evaluation_cache(self):
+        return self._evaluation_cache
+
+    @property
+    def stop(self):
+        return self._stop
+
+    def elapsed_time(self):
+        """
+        Method that calculates the time passed since the start of the search.
+
+        :return: Elapsed time in seconds.
+        :rtype: float
+        """
+
+        return time() - self._start
+
+    def visit(self):
+        """
+        Method that counts a visited node and stops the search once the deadline has passed or the search was stopped.
+
+        :raises SearchTimeout: If the deadline has passed or the search was stopped.
+        """
+
+        self._nodes += 1
+        if time() >= self._deadline or self._stop is not None and self._stop.value:
+            raise SearchTimeout("Search deadline has passed !")
@@ -0,0 +1,68 @@
+"""
+Module with the cooperative search, which runs minimax in slices on the thread of its caller.
+
+The search is a generator: it gives control back to its caller every few visited nodes, and the caller decides when
+to continue it. A single thread can thus interleave the search with drawing the window, or run the searches of many
+games at once, e.g. by calling next() once per frame of the pygame loop or once per step of an asyncio task:
+
+    search = cooperative_play(board, hash_map, current_node)
+    try:
+        while True:
+            best_move, depth = next(search)
+            ...
+    except StopIteration as result:
+        row, column, depth = result.value
+"""
+
+from bot_logic.search import *
+
+
+def cooperative_play(board, hash_map, current_node, time_limit=TIME_LIMIT, slice_nodes=SLICE_NODES,
+                     evaluation_cache=None):
+    """
+    Function that searches the bot's move with iterative deepening of minimax_steps, as a generator.
+    The search runs on a copy of the board, so the board may be drawn while the search is paused. Every time the search
+    gives control back, the generator yields the best move of the last completed depth. The time limit counts the time
+    of the whole search, including the time spent by the caller between the slices, and the caller may also stop the
+    search early by closing the generator. If there are no legal moves, the generator returns no move at once.
+
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param time_limit: Time in seconds available for the move.
+    :type time_limit: float
+    :param slice_nodes: Number of nodes visited between two yields.
+    :type slice_nodes: int
+    :param evaluation_cache: Cache of leaf evaluations to reuse between moves.
+    :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+
+    :return: Generator yielding the best move so far and its depth, and returning the row and column of the field where
+             the move will be played and the depth of the search, or None, None and 0 if there are no legal moves.
+    :rtype: collections.abc.Generator[tuple[tuple[int, int], int], NoneType, tuple[int, int, int]]
+    """
+
+    if len(board.legal_moves) == 0:
+        return None, None, 0
+    state = board.copy()
+    context = SearchContext(time_limit, evaluation_cache=evaluation_cache)
+    if isinstance(hash_map, TranspositionTable):
+        hash_map.new_search()
+    best_move = state.legal_moves[0]
+    depth = 0
+    for search_depth in range(1, ROWS * COLUMNS - state.black - state.white + 1):
+        search = minimax_steps(state, search_depth, hash_map, current_node, context, state.playing,
+                               slice_nodes=slice_nodes)
+        try:
+            while True:
+                next(search)
+                yield best_move, depth
+        except StopIteration as result:
+            best_move = result.value[1]
+            depth = search_depth
+        except SearchTimeout:
+            break
+    row, col = best_move
+    return row, col, depth
@@ -0,0 +1,214 @@
+"""
+Module containing the exact endgame solver.
+
+Once only a few fields are empty, the game can be searched to its very end, so instead of the heuristic evaluation
+the solver calculates the final difference in the number of pieces with perfect play from both sides. It works
+directly on the bitboards of the two players, without Board objects.
+"""
+
+from bot_logic.context import *
+from game_structures import bitboard
+
+WIN_LOSS_DRAW = "wld"
+EXACT_SCORE = "exact"
+
+# Below this number of empty fields, moves are only ordered by parity.
+FASTEST_FIRST_EMPTIES = 7
+# Below this number of empty fields, the empty fields are tried directly instead of generating legal moves.
+LAST_EMPTIES = 4
+
+QUADRANTS = (0x000000000F0F0F0F, 0x00000000F0F0F0F0, 0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+
+
+def solve_endgame(board, context, variant=EXACT_SCORE, outcome=None):
+    """
+    Function that solves the position on the board until the end of the game.
+
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param variant: WIN_LOSS_DRAW to only find out the outcome, or EXACT_SCORE for the exact final difference.
+    :type variant: str
+    :param outcome: Result of the WIN_LOSS_DRAW variant, if known, which narrows the window of the exact search.
+    :type outcome: int or NoneType
+
+    :return: Final difference in pieces from the point of view of the player on the move, and the best move. In the
+             WIN_LOSS_DRAW variant, only the sign of the difference is exact.
+    :rtype: tuple[int, tuple[int, int]]
+
+    :raises SearchTimeout: If the deadline of the search has passed.
+    """
+
+    if board.playing == BLACK:
+        player, opponent = board.black_bits, board.white_bits
+    else:
+        player, opponent = board.white_bits, board.black_bits
+    if variant == WIN_LOSS_DRAW:
+        alpha, beta = -1, 1
+    elif outcome is not None and outcome > 0:
+        alpha, beta = 0, ROWS * COLUMNS
+    elif outcome is not None and outcome < 0:
+        alpha, beta = -ROWS * COLUMNS, 0
+    else:
+        alpha, beta = -ROWS * COLUMNS, ROWS * COLUMNS
+
+    empty_fields = ROWS * COLUMNS - bitboard.popcount(player | opponent)
+    best_value = -ROWS * COLUMNS - 1
+    best_move = None
+    for move in _ordered_moves(board.legal_bits, player, opponent, empty_fields):
+        flipped = bitboard.flips(move, player, opponent)
+        value = -_solve(opponent ^ flipped, player | move | flipped, -beta, -alpha, empty_fields - 1, context)
+        if value > best_value:
+            best_value = value
+            best_move = bitboard.position(move.bit_length() - 1)
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+    return best_value, best_move
+
+
+def _solve(player, opponent, alpha, beta, empty_fields, context):
+    """
+    Private recursive function of the negamax search to the end of the game.
+
+    :param player: Bitboard of the player on the move.
+    :type player: int
+    :param opponent: Bitboard of the opponent.
+    :type opponent: int
+    :param alpha: The minimum value that can be achieved.
+    :type alpha: int
+    :param beta: The maximum value that can be achieved.
+    :type beta: int
+    :param empty_fields: Number of empty fields.
+    :type empty_fields: int
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+
+    :return: Final difference in pieces from the point of view of the player on the move.
+    :rtype: int
+    """
+
+    context.visit()
+    if empty_fields <= LAST_EMPTIES:
+        return _solve_last(player, opponent, alpha, beta, empty_fields, context)
+
+    moves = bitboard.legal_moves(player, opponent)
+    if not moves:
+        return bitboard.popcount(player) - bitboard.popcount(opponent)
+
+    best_value = -ROWS * COLUMNS - 1
+    for move in _ordered_moves(moves, player, opponent, empty_fields):
+        flipped = bitboard.flips(move, player, opponent)
+        value = -_solve(opponent ^ flipped, player | move | flipped, -beta, -alpha, empty_fields - 1, context)
+        if value > best_value:
+            best_value = value
+            if value > alpha:
+                alpha = value
+                if alpha >= beta:
+                    break
+    return best_value
+
+
+def _solve_last(player, opponent, alpha, beta, empty_fields, context):
+    """
+    Private recursive function specialized for the last few empty fields. Legal moves are not generated; every empty
+    field is tried directly, in parity order, and it is a legal move if it flips at least one piece.
+
+    :param player: Bitboard of the player on the move.
+    :type player: int
+    :param opponent: Bitboard of the opponent.
+    :type opponent: int
+    :param alpha: The minimum value that can be achieved.
+    :type alpha: int
+    :param beta: The maximum value that can be achieved.
+    :type beta: int
+    :param empty_fields: Number of empty fields.
+    :type empty_fields: int
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+
+    :return: Final difference in pieces from the point of view of the player on the move.
+    :rtype: int
+    """
+
+    empty = ~(player | opponent) & bitboard.FULL
+    best_value = None
+    for move in _parity_order(empty, empty):
+        flipped = bitboard.flips(move, player, opponent)
+        if not flipped:
+            continue
+        if empty_fields == 1:
+            return bitboard.popcount(player) - bitboard.popcount(opponent) + 2 * bitboard.popcount(flipped) + 1
+        context.visit()
+        value = -_solve_last(opponent ^ flipped, player | move | flipped, -beta, -alpha, empty_fields - 1, context)
+        if best_value is None or value > best_value:
+            best_value = value
+            if value > alpha:
+                alpha = value
+                if alpha >= beta:
+                    break
+    if best_value is None:
+        return bitboard.popcount(player) - bitboard.popcount(opponent)
+    return best_value
+
+
+def _ordered_moves(moves, player, opponent, empty_fields):
+    """
+    Private function that orders the moves. With many empty fields, the moves that leave the opponent with the fewest
+    replies are tried first (fastest-first); ties, and all moves closer to the end, are ordered by parity.
+
+    :param moves: Bitboard of the legal moves.
+    :type moves: int
+    :param player: Bitboard of the player on the move.
+    :type player: int
+    :param opponent: Bitboard of the opponent.
+    :type opponent: int
+    :param empty_fields: Number of empty fields.
+    :type empty_fields: int
+
+    :return: Single-bit bitboards of the moves, in the order they should be tried.
+    :rtype: list
+    """
+
+    empty = ~(player | opponent) & bitboard.FULL
+    if empty_fields <= FASTEST_FIRST_EMPTIES:
+        return _parity_order(moves, empty)
+    ordered = []
+    for move in _parity_order(moves, empty):
+        flipped = bitboard.flips(move, player, opponent)
+        replies = bitboard.popcount(bitboard.legal_moves(opponent ^ flipped, player | move | flipped))
+        ordered.append((replies, len(ordered), move))
+    ordered.sort()
+    return [move for _, _, move in ordered]
+
+
+def _parity_order(moves, empty):
+    """
+    Private function that orders the moves by parity: moves in quadrants with an odd number of empty fields come
+    first, because the player who moves last in a region usually keeps the pieces there.
+
+    :param moves: Bitboard of the moves.
+    :type moves: int
+    :param empty: Bitboard of the empty fields.
+    :type empty: int
+
+    :return: Single-bit bitboards of the moves.
+    :rtype: list
+    """
+
+    odd = []
+    even = []
+    for quadrant in QUADRANTS:
+        quadrant_moves = moves & quadrant
+        if not quadrant_moves:
+            continue
+        if bitboard.popcount(empty & quadrant) & 1:
+            target = odd
+        else:
+            target = even
+        while quadrant_moves:
+            move = quadrant_moves & -quadrant_moves
+            target.append(move)
+            quadrant_moves ^= move
+    return odd + even
@@ -3,6 +3,80 @@ Module containing functions for calculating heuristics.
 """
 
 from game_structures.Game import *
+from game_structures import bitboard
+from game_structures import patterns
+from bot_logic import pattern_tables
+from hashlib import blake2b
+
+STATIC_EVALUATOR = "static"
+PATTERN_EVALUATOR = "pattern"
+
+CORNERS = tuple(1 << bitboard.square(row, column) for row in (0, ROWS - 1) for column in (0, COLUMNS - 1))
+ALL_CORNERS = CORNERS[0] | CORNERS[1] | CORNERS[2] | CORNERS[3]
+# Fields counted next to each empty corner: the two edge fields and the diagonal field that touch the corner. The masks
+# map onto each other under every symmetry of the board, so the evaluation of symmetric positions is the same.
+NEAR_CORNERS = tuple(
+    (1 << bitboard.square(row, 1 if column == 0 else 6)) | (1 << bitboard.square(1 if row == 0 else 6, column))
+    | (1 << bitboard.square(1 if row == 0 else 6, 1 if column == 0 else 6))
+    for row in (0, ROWS - 1) for column in (0, COLUMNS - 1))
+
+# Table of every pattern instance, or None while the static evaluation is used.
+_instance_tables = None
+# Fingerprint of the evaluation, set by set_evaluator.
+_fingerprint = None
+
+
+def set_evaluator(evaluator=STATIC_EVALUATOR, file_path=pattern_tables.PATTERN_FILE):
+    """
+    Function for choosing the evaluation used by calculate_heuristics. The pattern tables are loaded from the file
+    once, when the pattern evaluation is chosen.
+
+    :param evaluator: STATIC_EVALUATOR or PATTERN_EVALUATOR.
+    :type evaluator: str
+    :param file_path: Path of the file with the pattern tables.
+    :type file_path: str
+    """
+
+    global _instance_tables, _fingerprint
+    digest = blake2b(digest_size=8)
+    digest.update(evaluator.encode())
+    if evaluator == PATTERN_EVALUATOR:
+        tables = pattern_tables.load_pattern_tables(file_path)
+        _instance_tables = tuple(tables[pattern] for pattern in patterns.INSTANCE_PATTERNS)
+        for table in tables:
+            digest.update(table.tobytes())
+    else:
+        _instance_tables = None
+        digest.update(repr((SQUARE_WEIGHTS, NEAR_CORNERS)).encode())
+    _fingerprint = int.from_bytes(digest.digest(), "little")
+
+
+def current_evaluator():
+    """
+    Function that tells which evaluation is used by calculate_heuristics.
+
+    :return: STATIC_EVALUATOR or PATTERN_EVALUATOR.
+    :rtype: str
+    """
+
+    if _instance_tables is not None:
+        return PATTERN_EVALUATOR
+    return STATIC_EVALUATOR
+
+
+def evaluator_fingerprint():
+    """
+    Function that calculates a fingerprint of the evaluation used by calculate_heuristics: a hash of the evaluation
+    and of its field weights or pattern tables. Cached leaf evaluations and the values in a saved search table are
+    only valid for an evaluation with the same fingerprint.
+
+    :return: 64-bit fingerprint.
+    :rtype: int
+    """
+
+    if _fingerprint is None:
+        set_evaluator(current_evaluator())
+    return _fingerprint
 
 
 def calculate_heuristics(board):
@@ -18,9 +92,33 @@ def calculate_heuristics(board):
 
     color = board.playing
 
+    if _instance_tables is not None:
+        return pattern_heuristics(board, color)
     return heuristics_score(board, color)
 
 
+def pattern_heuristics(board, color):
+    """
+    Helper function for calculating the heuristic from the pattern tables, by looking up the value of every pattern
+    instance under the index kept by the board.
+
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+    :param color: Player making the move.
+    :type color: tuple[int, int, int]
+
+    :return: Heuristic value.
+    :rtype: float
+    """
+
+    score = 0
+    for table, index in zip(_instance_tables, board.patterns):
+        score += table[index]
+    if color == WHITE:
+        return -score
+    return score
+
+
 def heuristics_score(board, color):
     """
     Helper function for calculating the heuristic.
@@ -79,40 +177,14 @@ def board_heuristics(board, color):
     :rtype: float
     """
 
-    row1 = [20, -3, 11,  8,  8, 11, -3, 20]
-    row2 = [-3, -7, -4,  1,  1, -4, -7, -3]
-    row3 = [11, -4,  2,  2,  2,  2, -4, 11]
-    row4 = [+8,  1,  2, -3, -3,  2,  1,  8]
-    row5 = [+8,  1,  2, -3, -3,  2,  1,  8]
-    row6 = [11, -4,  2,  2,  2,  2, -4, 11]
-    row7 = [-3, -7, -4,  1,  1, -4, -7, -3]
-    row8 = [20, -3, 11,  8,  8, 11, -3, 20]
-
-    heuristics = [row1, row2, row3, row4, row5, row6, row7, row8]
-    board_score = 0
-
-    front_row = [-1, -1, 0, 1, 1, 1, 0, -1]
-    front_col = [0, 1, 1, 1, 0, -1, -1, -1]
-    this_front = 0
-    other_front = 0
-
-    tokens = board.state
-    for row in range(ROWS):
-        for col in range(COLUMNS):
-            token = tokens[row][col]
-            if token != 0:
-                if token.color == color:
-                    board_score += heuristics[row][col]
-                else:
-                    board_score -= heuristics[row][col]
-                for k in range(ROWS):
-                    x = row + front_row[k]
-                    y = col + front_col[k]
-                    if 0 <= x < 8 and 0 <= y < 8 and tokens[x][y] == 0:
-                        if token.color == color:
-                            this_front += 1
-                        else:
-                            other_front += 1
+    if color == WHITE:
+        board_score = board.white_weight - board.black_weight
+        this_front = board.white_frontier
+        other_front = board.black_frontier
+    else:
+        board_score = board.black_weight - board.white_weight
+        this_front = board.black_frontier
+        other_front = board.white_frontier
 
     if this_front > other_front:
         front_score = -(100.0 * this_front)/(this_front + other_front)
@@ -173,40 +245,16 @@ def corners_heuristics(board, color):
     :rtype: float
     """
 
-    tokens = board.state
-    corners_score = 0
-    near_corner_score = 0
+    if color == WHITE:
+        this_bits, other_bits = board.white_bits, board.black_bits
+    else:
+        this_bits, other_bits = board.black_bits, board.white_bits
 
-    for i in [0, 7]:
-        for j in [0, 7]:
-            if tokens[i][j] != 0:
-                if tokens[i][j].color == color:
-                    corners_score += 1
-                else:
-                    corners_score -= 1
-            else:
-                for k in [1, 6]:
-                    if tokens[j][k] != 0:
-                        if tokens[j][k].color == color:
-                            near_corner_score += 1
-                        else:
-                            near_corner_score -= 1
-                    if tokens[k][j] != 0:
-                        if tokens[k][j].color == color:
-                            near_corner_score += 1
-                        else:
-                            near_corner_score -= 1
-                k = 1
-                m = 1
-                if i == 7:
-                    k = 6
-                if j == 7:
-                    m = 6
-                if tokens[k][m] != 0:
-                    if tokens[k][m].color == color:
-                        near_corner_score += 1
-                    else:
-                        near_corner_score -= 1
+    corners_score = bitboard.popcount(this_bits & ALL_CORNERS) - bitboard.popcount(other_bits & ALL_CORNERS)
+    near_corner_score = 0
+    for corner, near_corner in zip(CORNERS, NEAR_CORNERS):
+        if not (this_bits | other_bits) & corner:
+            near_corner_score += bitboard.popcount(this_bits & near_corner) - bitboard.popcount(other_bits & near_corner)
 
     corners_score *= 801.724 * 25
     near_corner_score *= -12.5 * 382.026
@@ -0,0 +1,149 @@
+"""
+Module with the Lazy SMP search, the second parallel strategy of the bot.
+
+The main process and several helper processes all run iterative deepening of the same root position, with half of
+the helpers starting one depth deeper, and all of them share one SharedTranspositionTable. The helpers do not return
+any moves; they only fill the shared table with values and best moves that the main search then finds ready. The move
+of the main search is played, and the helpers are stopped as soon as the main search finishes.
+"""
+
+from bot_logic.search import *
+from data_structures.SharedTranspositionTable import *
+from multiprocessing import Pool, RawValue
+from time import time
+import atexit
+
+# State of a helper process, set by _init_helper.
+_helper_table = None
+_helper_stop = None
+
+# Pool and table shared by all searches of the bot, created on the first Lazy SMP search.
+_pool = None
+_pool_workers = 0
+_pool_table = None
+_pool_stop = None
+
+
+def _init_helper(table, stop, evaluator):
+    """
+    Private function that prepares a helper process.
+
+    :param table: Search table shared by all processes.
+    :type table: data_structures.SharedTranspositionTable.SharedTranspositionTable
+    :param stop: Flag that stops the helpers.
+    :type stop: ctypes.c_byte
+    :param evaluator: Evaluation used by the main process.
+    :type evaluator: str
+    """
+
+    global _helper_table, _helper_stop
+    _helper_table = table
+    _helper_stop = stop
+    set_evaluator(evaluator)
+
+
+def _helper_search(task):
+    """
+    Private function that runs iterative deepening in a helper process until the deadline or the stop flag.
+
+    :param task: Board, first depth, maximum depth and deadline of the search.
+    :type task: tuple[game_structures.Board.Board, int, int, float]
+
+    :return: Last completed depth and the number of visited nodes.
+    :rtype: tuple[int, int]
+    """
+
+    board, first_depth, max_depth, deadline = task
+    context = SearchContext(deadline - time(), stop=_helper_stop)
+    depth = 0
+    for search_depth in range(first_depth, max_depth + 1):
+        try:
+            negamax(board, search_depth, _helper_table, TreeNode(None), context)
+        except SearchTimeout:
+            break
+        depth = search_depth
+    return depth, context.nodes
+
+
+def get_smp_pool(workers, table_megabytes=16):
+    """
+    Function that returns the helper processes and the shared table, creating them again if the number of workers
+    has changed.
+
+    :param workers: Number of processes searching, including the main one.
+    :type workers: int
+    :param table_megabytes: Size of the shared search table, in megabytes.
+    :type table_megabytes: int or float
+
+    :return: Pool of the helpers, the shared table and the stop flag.
+    :rtype: tuple[multiprocessing.pool.Pool, SharedTranspositionTable, ctypes.c_byte]
+    """
+
+    global _pool, _pool_workers, _pool_table, _pool_stop
+    if _pool is None or _pool_workers != workers:
+        close_smp_pool()
+        _pool_table = SharedTranspositionTable(table_megabytes, SYMMETRIC_TABLE)
+        _pool_stop = RawValue('b', 0)
+        _pool = Pool(workers - 1, _init_helper, (_pool_table, _pool_stop, current_evaluator()))
+        _pool_workers = workers
+    return _pool, _pool_table, _pool_stop
+
+
+def close_smp_pool():
+    """
+    Function that stops the helper processes and frees the shared table, if they exist.
+    """
+
+    global _pool, _pool_workers, _pool_table
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool_table.close()
+        _pool_table.unlink()
+        _pool = None
+        _pool_workers = 0
+        _pool_table = None
+
+
+# The shared memory has to be freed even if the game ends without closing the pool.
+atexit.register(close_smp_pool)
+
+
+def lazy_smp(board, current_node, context, max_depth, workers):
+    """
+    Function that searches the root position with Lazy SMP.
+
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param context: Context of the search of the main process.
+    :type context: bot_logic.context.SearchContext
+    :param max_depth: Maximum depth.
+    :type max_depth: int
+    :param workers: Number of processes searching, including the main one.
+    :type workers: int
+
+    :return: Best move of the last search completed by the main process and its depth.
+    :rtype: tuple[tuple[int, int], int]
+    """
+
+    pool, table, stop = get_smp_pool(workers)
+    table.new_search()
+    stop.value = 0
+    helpers = [pool.apply_async(_helper_search, ((board, 1 + (helper + 1) % 2, max_depth, context.deadline),))
+               for helper in range(workers - 1)]
+
+    best_move = board.legal_moves[0]
+    depth = 0
+    for search_depth in range(1, max_depth + 1):
+        try:
+            best_move = negamax(board, search_depth, table, current_node, context)[1]
+        except SearchTimeout:
+            break
+        depth = search_depth
+
+    stop.value = 1
+    for helper in helpers:
+        helper.get()
+    return best_move, depth
@@ -0,0 +1,125 @@
+"""
+Module for building the opening book and for looking up the bot's moves in it.
+
+The book holds the best move of the white player in the positions of the first moves of the game. It is built offline
+by expanding every move of the black player and only the best move of the white player, which is found with a fixed
+depth search. Positions are keyed by their canonical key, so the positions that are symmetric to each other share one
+entry, and the moves are stored in the orientation of the canonical image of the position.
+
+Running this module builds the book and writes it to BOOK_FILE.
+"""
+
+from bot_logic.search import *
+from data_structures.OpeningBook import *
+from os import path
+
+BOOK_FILE = path.join(path.dirname(path.abspath(__file__)), "book.bin")
+
+# Opening book used by the bot, set by set_opening_book.
+_book = None
+
+
+def build_opening_book(plies=10, depth=8):
+    """
+    Function that builds the entries of the opening book from the initial position.
+
+    :param plies: Number of moves from the initial position that are covered by the book.
+    :type plies: int
+    :param depth: Depth of the search of the white player's moves.
+    :type depth: int
+
+    :return: Best move (index of the bit of its field in the canonical image), depth and value for every canonical key.
+    :rtype: dict[int, tuple[int, int, float]]
+    """
+
+    entries = {}
+    _expand(Board(1), plies, depth, TranspositionTable(), entries, set())
+    return entries
+
+
+def _expand(board, plies, depth, hash_map, entries, expanded):
+    """
+    Private function that adds the positions reachable from the board in the given number of moves to the book.
+
+    :param board: Current state of the board, changed in place and restored.
+    :type board: game_structures.Board.Board
+    :param plies: Number of moves still covered by the book.
+    :type plies: int
+    :param depth: Depth of the search of the white player's moves.
+    :type depth: int
+    :param hash_map: Search table shared by all searches of the builder.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable
+    :param entries: Entries of the book found so far.
+    :type entries: dict[int, tuple[int, int, float]]
+    :param expanded: Canonical keys of the positions of the black player that were already expanded.
+    :type expanded: set[int]
+    """
+
+    if plies == 0 or len(board.legal_moves) == 0:
+        return
+    player = board.playing
+    key, symmetry = board.canonical_key
+    if player == WHITE:
+        if key in entries:
+            return
+        value, move = negamax(board, depth, hash_map, TreeNode(None), SearchContext(inf))
+        entries[key] = bitboard.transform_square(bitboard.square(*move), symmetry), depth, value
+        moves = [move]
+    else:
+        if key in expanded:
+            return
+        expanded.add(key)
+        moves = board.legal_moves
+    for row, column in moves:
+        record = board.make_move(row, column, player)
+        try:
+            _expand(board, plies - 1, depth, hash_map, entries, expanded)
+        finally:
+            board.unmake_move(record)
+
+
+def set_opening_book(file_path=BOOK_FILE):
+    """
+    Function that opens the opening book used by the bot, closing the previous one.
+
+    :param file_path: Path of the book, or None to play without a book.
+    :type file_path: str or NoneType
+
+    :raises ValueError: If the file is not an opening book of this version.
+    """
+
+    global _book
+    if _book is not None:
+        _book.close()
+        _book = None
+    if file_path is not None:
+        _book = OpeningBook(file_path)
+
+
+def book_move(board):
+    """
+    Function that looks up the move for the position in the opening book.
+
+    :param board: Current state of the board.
+    :type board: game_structures.Board.Board
+
+    :return: Row and column of the move and the depth it was searched to, or None if the position is not in the book.
+    :rtype: tuple[int, int, int] or NoneType
+    """
+
+    if _book is None:
+        return None
+    key, symmetry = board.canonical_key
+    entry = _book.probe(key)
+    if entry is None:
+        return None
+    move, depth = entry[0], entry[1]
+    index = bitboard.transform_square(move, bitboard.INVERSE_SYMMETRIES[symmetry])
+    if not board.legal_bits >> index & 1:
+        return None
+    row, column = bitboard.position(index)
+    return row, column, depth
+
+
+if __name__ == '__main__':
+    write_opening_book(build_opening_book(), BOOK_FILE)
@@ -0,0 +1,116 @@
+"""
+Module with the MoveOrdering class, which decides in what order the search tries the moves.
+"""
+
+from bot_logic.heuristics import *
+
+
+class MoveOrdering(object):
+    """
+    Class MoveOrdering models the move ordering of one search.
+
+    Moves are tried in the following order: the best move stored in the search table, the killer moves of the current
+    ply (moves that recently caused a cutoff in a sibling position), and then all other moves ranked by the history
+    table (how often and how deep a move caused cutoffs) plus the static weight of its field.
+    """
+
+    def __init__(self):
+        """
+        Constructor of the MoveOrdering class.
+        """
+
+        self._killers = [[None, None] for _ in range(ROWS * COLUMNS)]
+        self._history = {BLACK: [0] * (ROWS * COLUMNS), WHITE: [0] * (ROWS * COLUMNS)}
+        self._cutoffs = 0
+        self._first_move_cutoffs = 0
+        self._hash_move_cutoffs = 0
+        self._killer_cutoffs = 0
+
+    @property
+    def cutoffs(self):
+        return self._cutoffs
+
+    @property
+    def first_move_cutoffs(self):
+        return self._first_move_cutoffs
+
+    @property
+    def hash_move_cutoffs(self):
+        return self._hash_move_cutoffs
+
+    @property
+    def killer_cutoffs(self):
+        return self._killer_cutoffs
+
+    @property
+    def first_move_cutoff_rate(self):
+        if self._cutoffs == 0:
+            return 0.0
+        return self._first_move_cutoffs / self._cutoffs
+
+    def order(self, moves, ply, color, hash_move=None):
+        """
+        Method that sorts the moves from the most to the least promising one.
+
+        :param moves: Legal moves.
+        :type moves: list
+        :param ply: Distance of the position from the root of the search.
+        :type ply: int
+        :param color: Player making the move.
+        :type color: tuple[int, int, int]
+        :param hash_move: Best move stored in the search table.
+        :type hash_move: tuple[int, int] or NoneType
+
+        :return: Sorted moves.
+        :rtype: list
+        """
+
+        first_killer, second_killer = self._killers[ply]
+        history = self._history[color]
+
+        def priority(move):
+            row, column = move
+            if move == hash_move:
+                rank = 3
+            elif move == first_killer:
+                rank = 2
+            elif move == second_killer:
+                rank = 1
+            else:
+                rank = 0
+            return rank, history[row * COLUMNS + column] + SQUARE_WEIGHTS[row][column]
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def cutoff(self, move, ply, color, depth, index, hash_move=None):
+        """
+        Method that records a move that caused a beta cutoff.
+
+        :param move: Move that caused the cutoff.
+        :type move: tuple[int, int]
+        :param ply: Distance of the position from the root of the search.
+        :type ply: int
+        :param color: Player making the move.
+        :type color: tuple[int, int, int]
+        :param depth: Remaining depth of the position.
+        :type depth: int
+        :param index: Position of the move in the ordered list of moves.
+        :type index: int
+        :param hash_move: Best move stored in the search table.
+        :type hash_move: tuple[int, int] or NoneType
+        """
+
+        killers = self._killers[ply]
+        self._cutoffs += 1
+        if index == 0:
+            self._first_move_cutoffs += 1
+        if move == hash_move:
+            self._hash_move_cutoffs += 1
+        elif move in killers:
+            self._killer_cutoffs += 1
+
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        row, column = move
+        self._history[color][row * COLUMNS + column] += depth * depth
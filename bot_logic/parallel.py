@@ -0,0 +1,214 @@
+"""
+Module with the parallel search, which splits the moves at the root of the search between several processes.
+
+The first root move is searched alone, the same way the serial search starts, and its value becomes the shared alpha
+bound. The remaining root moves are then searched by a pool of worker processes, each with its own search table. Every
+worker reads the shared bound once, when it starts a move, and raises it as soon as it finds a better one; a move that
+is already being searched keeps its window. A move is searched with a window that starts just below the bound it has
+read, so every move at least as good as the best one gets its exact value, and the best move is chosen exactly as in
+the serial search: the highest value, and among equal values the one ordered first.
+
+The guarantee is therefore: at every depth, the value is the value of the serial negamax, and the move is the move the
+serial negamax chooses when it tries the root moves in the same order. The worker tables only carry over values that
+cannot change this result. A game has no passes, so the leaves of a search all have the same number of pieces, and a
+worker clears its table whenever a search reaches fewer pieces than the one before it (a new root search). Entries of
+the earlier iterations over the same root are then shallower than the current search needs and only order the moves.
+The order of the root moves itself comes from the move ordering of the main process, which does not see the cutoffs
+inside the workers, so across iterative deepening it may differ from the order of a serial search; among moves of
+equal value, the parallel and the serial search may then choose different ones.
+"""
+
+from bot_logic.search import *
+from multiprocessing import Pool, RawValue, TimeoutError, Value
+from time import time
+
+# Time in seconds between two checks of the stop flag of the search while waiting for the workers.
+POLL_INTERVAL = 0.005
+
+# State of a worker process, set by _init_worker.
+_worker_alpha = None
+_worker_stop = None
+_worker_table = None
+_worker_horizon = 0
+
+# Pool shared by all searches of the bot, created on the first parallel search.
+_pool = None
+_pool_workers = 0
+_pool_alpha = None
+_pool_stop = None
+
+
+def _init_worker(shared_alpha, stop, evaluator, table_megabytes):
+    """
+    Private function that prepares a worker process.
+
+    :param shared_alpha: Alpha bound shared by all workers.
+    :type shared_alpha: multiprocessing.Value
+    :param stop: Flag that stops the searches of all workers.
+    :type stop: ctypes.c_byte
+    :param evaluator: Evaluation used by the parent process.
+    :type evaluator: str
+    :param table_megabytes: Size of the search table of the worker, in megabytes.
+    :type table_megabytes: int or float
+    """
+
+    global _worker_alpha, _worker_stop, _worker_table
+    _worker_alpha = shared_alpha
+    _worker_stop = stop
+    _worker_table = TranspositionTable(table_megabytes, SYMMETRIC_TABLE)
+    set_evaluator(evaluator)
+
+
+def _search_move(task):
+    """
+    Private function that searches one root move in a worker process. The search table of the worker is cleared
+    first if the search reaches fewer pieces than the previous one, i.e. if it belongs to a new root search.
+
+    :param task: Index of the move, the board, the move, the depth and the deadline of the search.
+    :type task: tuple[int, game_structures.Board.Board, tuple[int, int], int, float]
+
+    :return: Index of the move, its value (None if the deadline has passed or the search was stopped) and whether the
+             value is exact.
+    :rtype: tuple[int, float or NoneType, bool]
+    """
+
+    global _worker_horizon
+    index, board, (row, column), depth, deadline = task
+    horizon = board.black + board.white + depth
+    if horizon < _worker_horizon:
+        _worker_table.clear()
+    _worker_horizon = horizon
+    context = SearchContext(deadline - time(), stop=_worker_stop)
+    alpha = nextafter(_worker_alpha.value, -inf)
+    board.make_move(row, column, board.playing)
+    try:
+        value = -negamax(board, depth - 1, _worker_table, TreeNode(None), context, -inf, -alpha, 1)[0]
+    except SearchTimeout:
+        return index, None, False
+    if value > alpha:
+        with _worker_alpha.get_lock():
+            if value > _worker_alpha.value:
+                _worker_alpha.value = value
+        return index, value, True
+    return index, value, False
+
+
+def _wait_results(results, count, context, stop):
+    """
+    Private function that collects the results of the workers. While it waits, it checks whether the search of the
+    context was stopped and passes the stop on to the workers, which then return without values.
+
+    :param results: Iterator over the results of the workers.
+    :type results: multiprocessing.pool.IMapIterator
+    :param count: Number of results.
+    :type count: int
+    :param context: Context of the search in the main process.
+    :type context: bot_logic.context.SearchContext
+    :param stop: Flag that stops the searches of all workers.
+    :type stop: ctypes.c_byte
+
+    :return: Results of the workers.
+    :rtype: list[tuple[int, float or NoneType, bool]]
+    """
+
+    collected = []
+    while len(collected) < count:
+        try:
+            collected.append(results.next(POLL_INTERVAL))
+        except TimeoutError:
+            if context.stop is not None and context.stop.value:
+                stop.value = 1
+    return collected
+
+
+def get_pool(workers, table_megabytes=16):
+    """
+    Function that returns the pool of worker processes, creating it again if the number of workers has changed.
+
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param table_megabytes: Size of the search table of each worker, in megabytes.
+    :type table_megabytes: int or float
+
+    :return: Pool, the alpha bound shared by its workers and their stop flag.
+    :rtype: tuple[multiprocessing.pool.Pool, multiprocessing.Value, ctypes.c_byte]
+    """
+
+    global _pool, _pool_workers, _pool_alpha, _pool_stop
+    if _pool is None or _pool_workers != workers:
+        close_pool()
+        _pool_alpha = Value('d', -inf)
+        _pool_stop = RawValue('b', 0)
+        _pool = Pool(workers, _init_worker, (_pool_alpha, _pool_stop, current_evaluator(), table_megabytes))
+        _pool_workers = workers
+    return _pool, _pool_alpha, _pool_stop
+
+
+def close_pool():
+    """
+    Function that stops the worker processes, if they are running.
+    """
+
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+        _pool = None
+        _pool_workers = 0
+
+
+def parallel_negamax(state, depth, hash_map, context, workers):
+    """
+    Negamax search of the root position with the root moves split between worker processes. The result is the same
+    as the result of the serial negamax with the same order of the root moves, also over the iterations of iterative
+    deepening.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param depth: Depth.
+    :type depth: int
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param workers: Number of worker processes.
+    :type workers: int
+
+    :return: Heuristic value and best move.
+    :rtype: tuple[float, tuple[int, int]]
+
+    :raises SearchTimeout: If the deadline of the search has passed before all root moves were searched.
+    """
+
+    context.visit()
+    player = state.playing
+    hash_move = None
+    try:
+        hash_move = table_entry(hash_map, state)[3]
+    except KeyError:
+        pass
+    moves = context.ordering.order(state.legal_moves, 0, player, hash_move)
+    if depth == 0 or not moves:
+        return negamax(state, depth, hash_map, TreeNode(None), context)
+
+    pool, shared_alpha, stop = get_pool(workers)
+    shared_alpha.value = -inf
+    stop.value = 0
+    tasks = [(index, state, move, depth, context.deadline) for index, move in enumerate(moves)]
+    results = _wait_results(pool.imap_unordered(_search_move, tasks[:1]), 1, context, stop)
+    if results[0][1] is None:
+        raise SearchTimeout("Search deadline has passed !")
+    results.extend(_wait_results(pool.imap_unordered(_search_move, tasks[1:]), len(tasks) - 1, context, stop))
+
+    value = -inf
+    best_index = None
+    for index, move_value, exact in results:
+        if move_value is None:
+            raise SearchTimeout("Search deadline has passed !")
+        if exact and (move_value > value or move_value == value and index < best_index):
+            value = move_value
+            best_index = index
+    best_move = moves[best_index]
+    stored_value, stored_bound = white_point_of_view(value, EXACT, player)
+    store_entry(hash_map, state, depth, stored_bound, stored_value, best_move)
+    return value, best_move
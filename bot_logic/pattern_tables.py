@@ -0,0 +1,109 @@
+"""
+Module for building, saving and loading the tables of the pattern evaluation.
+
+Every pattern has one table with a value for each of its 3 ** n configurations, indexed by the ternary index that the
+Board keeps for every instance of the pattern. The values are seen from the point of view of the black player. The
+tables are stored in a binary file: a header (magic, version, number of patterns and the number of fields of every
+pattern) followed by all tables as little-endian 16-bit integers.
+
+Running this module builds the tables from the static field weights and the corner rules of the heuristics and writes
+them to PATTERN_FILE.
+"""
+
+from game_structures.patterns import *
+from array import array
+from os import path
+from sys import byteorder
+import struct
+
+PATTERN_FILE = path.join(path.dirname(path.abspath(__file__)), "patterns.bin")
+MAGIC = b"OTPT"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+
+INT16_MIN, INT16_MAX = -2 ** 15, 2 ** 15 - 1
+
+
+def build_pattern_tables():
+    """
+    Function that builds the tables from the static heuristics. The weight of every field is split between all the
+    instances that contain the field, the corner pattern rewards corners, and while a corner is empty it penalizes
+    the three fields next to it.
+
+    :return: Table of every pattern.
+    :rtype: list[array]
+    """
+
+    tables = []
+    for (name, fields), instances in zip(PATTERNS, PATTERN_INSTANCES):
+        squares = instances[0]
+        shares = [5 * SQUARE_WEIGHTS[row][column] / len(SQUARE_INSTANCES[square])
+                  for (row, column), square in zip(fields, squares)]
+        table = array('h', bytes(2 * 3 ** len(fields)))
+        for index in range(len(table)):
+            digits = []
+            rest = index
+            for _ in fields:
+                rest, digit = divmod(rest, 3)
+                digits.append(0 if digit == EMPTY_DIGIT else 1 if digit == BLACK_DIGIT else -1)
+            value = sum(sign * share for sign, share in zip(digits, shares))
+            if name == "corner":
+                if digits[0]:
+                    value += digits[0] * 801.724 * 25
+                else:
+                    value += (digits[1] + digits[3] + digits[4]) * -12.5 * 382.026
+            table[index] = min(max(round(value), INT16_MIN), INT16_MAX)
+        tables.append(table)
+    return tables
+
+
+def save_pattern_tables(tables, file_path=PATTERN_FILE):
+    """
+    Function that writes the tables to a binary file.
+
+    :param tables: Table of every pattern.
+    :type tables: list[array]
+    :param file_path: Path of the file.
+    :type file_path: str
+    """
+
+    with open(file_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(PATTERNS)))
+        file.write(bytes(len(fields) for _, fields in PATTERNS))
+        for table in tables:
+            if byteorder == "big":
+                table = array('h', table)
+                table.byteswap()
+            table.tofile(file)
+
+
+def load_pattern_tables(file_path=PATTERN_FILE):
+    """
+    Function that reads the tables from a binary file.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+
+    :return: Table of every pattern.
+    :rtype: list[array]
+
+    :raises ValueError: If the file does not match the patterns.
+    """
+
+    with open(file_path, "rb") as file:
+        magic, version, count = HEADER.unpack(file.read(HEADER.size))
+        lengths = tuple(file.read(count))
+        if magic != MAGIC or version != VERSION or lengths != tuple(len(fields) for _, fields in PATTERNS):
+            raise ValueError("Pattern file does not match the patterns !")
+        tables = []
+        for length in lengths:
+            table = array('h')
+            table.fromfile(file, 3 ** length)
+            if byteorder == "big":
+                table.byteswap()
+            tables.append(table)
+    return tables
+
+
+if __name__ == '__main__':
+    save_pattern_tables(build_pattern_tables())
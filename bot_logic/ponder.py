@@ -0,0 +1,105 @@
+"""
+Module with the Ponderer class, which lets the bot think while the human player chooses a move.
+"""
+
+from bot_logic.search import *
+from ctypes import c_byte
+from math import inf
+from threading import Thread
+
+
+class Ponderer(object):
+    """
+    Class Ponderer models the search running in a background thread on the human player's time.
+
+    After the bot moves, the position is searched from the point of view of the human player with iterative
+    deepening, so that the replies the human is most likely to play are searched the deepest. The values and best
+    moves end up in the search table, the first plies of the searched positions in the game tree (as reusable
+    subtrees of the human's replies), and the leaf evaluations in the evaluation cache; the bot's next search starts
+    from all of them once the pondering is stopped.
+    """
+
+    def __init__(self, hash_map, evaluation_cache=None):
+        """
+        Constructor of the Ponderer class.
+
+        :param hash_map: Search table shared with the bot.
+        :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+        :param evaluation_cache: Cache of leaf evaluations shared with the bot.
+        :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+        """
+
+        self._hash_map = hash_map
+        if evaluation_cache is None:
+            evaluation_cache = EvaluationCache()
+        self._evaluation_cache = evaluation_cache
+        self._thread = None
+        self._stop = c_byte(0)
+        self._depth = 0
+        self._nodes = 0
+
+    @property
+    def evaluation_cache(self):
+        return self._evaluation_cache
+
+    @property
+    def depth(self):
+        return self._depth
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, board, current_node):
+        """
+        Method that starts pondering the position in a background thread.
+
+        :param board: State of the board after the bot's move.
+        :type board: game_structures.Board.Board
+        :param current_node: Node of the game tree for the state.
+        :type current_node: data_structures.GameTree.TreeNode
+        """
+
+        self.stop()
+        if len(board.legal_moves) == 0:
+            return
+        self._stop.value = 0
+        self._depth = 0
+        self._nodes = 0
+        self._thread = Thread(target=self._ponder, args=(board.copy(), current_node), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Method that stops pondering and waits until the background thread has finished, so that the search table,
+        the game tree and the evaluation cache can be used by the bot again.
+        """
+
+        if self._thread is None:
+            return
+        self._stop.value = 1
+        self._thread.join()
+        self._thread = None
+
+    def _ponder(self, board, current_node):
+        """
+        Private method that runs in the background thread and deepens the search until it is stopped.
+
+        :param board: Copy of the state of the board, searched in place.
+        :type board: game_structures.Board.Board
+        :param current_node: Node of the game tree for the state.
+        :type current_node: data_structures.GameTree.TreeNode
+        """
+
+        context = SearchContext(inf, evaluation_cache=self._evaluation_cache, stop=self._stop)
+        for search_depth in range(1, ROWS * COLUMNS - board.black - board.white + 1):
+            try:
+                negamax(board, search_depth, self._hash_map, current_node, context)
+            except SearchTimeout:
+                break
+            self._depth = search_depth
+        self._nodes = context.nodes
@@ -0,0 +1,390 @@
+"""
+Module containing the search algorithms used by the bot and their helper functions.
+"""
+
+from bot_logic.heuristics import *
+from data_structures.GameTree import *
+from data_structures.TranspositionTable import *
+from bot_logic.context import *
+from bot_logic.batch import *
+from math import inf, nextafter
+
+
+def evaluate(state, cache=None):
+    """
+    Helper function that evaluates a leaf position from the point of view of the player on the move.
+    If a cache is given, a position that was already evaluated costs only one probe.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param cache: Cache of leaf evaluations.
+    :type cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+
+    :return: Heuristic value and the number of legal moves of the opponent.
+    :rtype: tuple[float, int]
+    """
+
+    if cache is not None:
+        entry = cache.probe(state.hash_key)
+        if entry is not None:
+            return entry
+    this_legal_moves, other_legal_moves = state.mobility()
+    value = calculate_heuristics(state)
+    value += mobility_heuristics(this_legal_moves, other_legal_moves)
+    if cache is not None:
+        cache.store(state.hash_key, value, other_legal_moves)
+    return value, other_legal_moves
+
+
+def white_point_of_view(value, bound, player):
+    """
+    Helper function that converts a value and its bound type between the point of view of the player on the move and
+    the point of view of the white player. The conversion is its own inverse.
+
+    :param value: Value.
+    :type value: float
+    :param bound: Type of the bound (EXACT, LOWER_BOUND or UPPER_BOUND).
+    :type bound: int
+    :param player: Player on the move.
+    :type player: tuple[int, int, int]
+
+    :return: Converted value and bound type.
+    :rtype: tuple[float, int]
+    """
+
+    if player == WHITE:
+        return value, bound
+    if bound == LOWER_BOUND:
+        bound = UPPER_BOUND
+    elif bound == UPPER_BOUND:
+        bound = LOWER_BOUND
+    return -value, bound
+
+
+def table_entry(hash_map, state):
+    """
+    Helper function that looks up the entry of a position in the search table. If the table is symmetric, the position
+    is looked up under its canonical key and the best move is transformed back from the canonical image of the
+    position.
+
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+
+    :return: Depth, bound type, value and best move.
+    :rtype: tuple[int, int, float, tuple[int, int] or NoneType]
+
+    :raises KeyError: If the position is not in the table.
+    """
+
+    if not hash_map.symmetric:
+        return hash_map[state.hash_key]
+    key, symmetry = state.canonical_key
+    depth, bound, value, move = hash_map[key]
+    if move is not None and symmetry:
+        index = bitboard.transform_square(bitboard.square(*move), bitboard.INVERSE_SYMMETRIES[symmetry])
+        move = bitboard.position(index)
+    return depth, bound, value, move
+
+
+def store_entry(hash_map, state, depth, bound, value, move):
+    """
+    Helper function that stores the entry of a position in the search table. If the table is symmetric, the position
+    is stored under its canonical key and the best move is transformed to the canonical image of the position.
+
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param depth: Depth at which the position was searched.
+    :type depth: int
+    :param bound: Type of the bound (EXACT, LOWER_BOUND or UPPER_BOUND).
+    :type bound: int
+    :param value: Value of the position.
+    :type value: float
+    :param move: Best move.
+    :type move: tuple[int, int] or NoneType
+    """
+
+    if not hash_map.symmetric:
+        hash_map[state.hash_key] = depth, bound, value, move
+        return
+    key, symmetry = state.canonical_key
+    if move is not None and symmetry:
+        move = bitboard.position(bitboard.transform_square(bitboard.square(*move), symmetry))
+    hash_map[key] = depth, bound, value, move
+
+
+def child_node(current_node, state, ply):
+    """
+    Helper function that finds the node of the game tree for the state reached from the current node, adding it if it
+    does not exist yet. The nodes hold the signature of their position (both bitboards packed into one integer)
+    instead of a copy of the board. Only the first TREE_PLIES plies of a search are added to the tree, so that it does
+    not grow with the number of searched nodes; deeper states share the node of their ancestor.
+
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param state: State of the board after the move.
+    :type state: game_structures.Board.Board
+    :param ply: Distance of the state from the root of the search.
+    :type ply: int
+
+    :return: Node of the state.
+    :rtype: data_structures.GameTree.TreeNode
+    """
+
+    if ply > TREE_PLIES:
+        return current_node
+    signature = state.signature
+    for current_child in current_node.children:
+        if signature == current_child.data:
+            return current_child
+    new_node = TreeNode(signature)
+    current_node.add_child(new_node)
+    return new_node
+
+
+def minimax_steps(state, depth, hash_map, current_node, context, player=WHITE, alpha=-float(inf), beta=float(inf),
+                  ply=0, slice_nodes=SLICE_NODES):
+    """
+    Minimax algorithm with alpha-beta pruning, written as a generator.
+    bot_logic is the white player, so in this case, the white player is the Maximizer, and the black player is the Minimizer.
+    Every searched position is stored in the hash map together with the depth it was searched to, the type of the
+    bound its value represents and the best move found, so that it is only reused when it is deep enough. Leaf
+    evaluations are kept in the evaluation cache of the context instead.
+    The generator yields None every time the number of visited nodes of the context reaches a multiple of slice_nodes,
+    so that the caller can interleave the search with other work; it never yields if slice_nodes is None. The result
+    of the search is the return value of the generator.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param depth: Depth.
+    :type depth: int
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param player: Player making the move.
+    :type player: tuple[int, int, int]
+    :param alpha: The minimum value that can be achieved.
+    :type alpha: float
+    :param beta: The maximum value that can be achieved.
+    :type beta: float
+    :param ply: Distance of the position from the root of the search.
+    :type ply: int
+    :param slice_nodes: Number of nodes visited between two yields, or None to run without yielding.
+    :type slice_nodes: int or NoneType
+
+    :return: Generator returning the heuristic value, best move, number of possible moves.
+    :rtype: collections.abc.Generator[NoneType, NoneType, tuple[int, tuple[int, int], int]]
+
+    :raises SearchTimeout: If the deadline of the search has passed.
+    """
+
+    context.visit()
+    if slice_nodes is not None and context.nodes % slice_nodes == 0:
+        yield
+    alpha_original, beta_original = alpha, beta
+    hash_move = None
+    try:
+        entry_depth, bound, entry_value, hash_move = table_entry(hash_map, state)
+    except KeyError:
+        pass
+    else:
+        if entry_depth >= depth:
+            if bound == EXACT:
+                return entry_value, hash_move, len(state.legal_moves)
+            elif bound == LOWER_BOUND:
+                alpha = max(alpha, entry_value)
+            else:
+                beta = min(beta, entry_value)
+            if alpha >= beta:
+                return entry_value, hash_move, len(state.legal_moves)
+
+    if depth == 0 or len(state.legal_moves) == 0:
+        value, future_legal_moves = evaluate(state, context.evaluation_cache)
+        if state.playing == BLACK:
+            value = -value
+        if depth > 0:
+            store_entry(hash_map, state, depth, EXACT, value, None)
+        return value, (None, None), future_legal_moves
+
+    moves = context.ordering.order(state.legal_moves, ply, player, hash_move)
+    opponent = BLACK if player == WHITE else WHITE
+    value = -100000000 if player == WHITE else 100000000
+    best_move = None
+    now_legal_moves = 0
+    for index, (legal_row, legal_column) in enumerate(moves):
+        record = state.make_move(legal_row, legal_column, player)
+        try:
+            tmp_legal_moves = len(state.legal_moves)
+            new_node = child_node(current_node, state, ply + 1)
+            new_value = (yield from minimax_steps(state, depth - 1, hash_map, new_node, context, opponent, alpha, beta,
+                                                  ply + 1, slice_nodes))[0]
+        finally:
+            state.unmake_move(record)
+        if player == WHITE and new_value > value or player == BLACK and new_value < value:
+            value = new_value
+            best_move = (legal_row, legal_column)
+            now_legal_moves = tmp_legal_moves
+        if player == WHITE:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if beta <= alpha:
+            context.ordering.cutoff((legal_row, legal_column), ply, player, depth, index, hash_move)
+            break
+
+    if best_move is None:
+        best_move = state.legal_moves[0]
+    if value <= alpha_original:
+        bound = UPPER_BOUND
+    elif value >= beta_original:
+        bound = LOWER_BOUND
+    else:
+        bound = EXACT
+    store_entry(hash_map, state, depth, bound, value, best_move)
+    return value, best_move, now_legal_moves
+
+
+def minimax(state, depth, hash_map, current_node, context, player=WHITE, alpha=-float(inf), beta=float(inf), ply=0):
+    """
+    Minimax algorithm with alpha-beta pruning.
+    bot_logic is the white player, so in this case, the white player is the Maximizer, and the black player is the Minimizer.
+    The search is the one of minimax_steps, run to the end without giving control back.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param depth: Depth.
+    :type depth: int
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param player: Player making the move.
+    :type player: tuple[int, int, int]
+    :param alpha: The minimum value that can be achieved.
+    :type alpha: float
+    :param beta: The maximum value that can be achieved.
+    :type beta: float
+    :param ply: Distance of the position from the root of the search.
+    :type ply: int
+
+    :return: Heuristic value, best move, number of possible moves.
+    :rtype: tuple[int, tuple[int, int], int]
+
+    :raises SearchTimeout: If the deadline of the search has passed.
+    """
+
+    search = minimax_steps(state, depth, hash_map, current_node, context, player, alpha, beta, ply, None)
+    try:
+        while True:
+            next(search)
+    except StopIteration as result:
+        return result.value
+
+
+def negamax(state, depth, hash_map, current_node, context, alpha=-float(inf), beta=float(inf), ply=0):
+    """
+    Negamax algorithm with alpha-beta pruning and principal variation search.
+    Values are always calculated from the point of view of the player on the move. The first move is searched with the
+    full window, and every other move only with a null window that tests whether it is better than the best move so
+    far; a move that passes this test is searched again with the full window.
+    Entries in the hash map are stored from the point of view of the white player, so they can be shared with minimax.
+    If the context allows it, the children of a node at depth 1 are all evaluated in one batch instead of one by one.
+
+    :param state: Current state of the board.
+    :type state: game_structures.Board.Board
+    :param depth: Depth.
+    :type depth: int
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+    :param current_node: Current node of the tree.
+    :type current_node: data_structures.GameTree.TreeNode
+    :param context: Context of the search, shared by all nodes.
+    :type context: bot_logic.context.SearchContext
+    :param alpha: The minimum value that can be achieved.
+    :type alpha: float
+    :param beta: The maximum value that can be achieved.
+    :type beta: float
+    :param ply: Distance of the position from the root of the search.
+    :type ply: int
+
+    :return: Heuristic value and best move.
+    :rtype: tuple[float, tuple[int, int]]
+
+    :raises SearchTimeout: If the deadline of the search has passed.
+    """
+
+    context.visit()
+    player = state.playing
+    alpha_original, beta_original = alpha, beta
+    hash_move = None
+    try:
+        entry_depth, bound, entry_value, hash_move = table_entry(hash_map, state)
+    except KeyError:
+        pass
+    else:
+        if entry_depth >= depth:
+            entry_value, bound = white_point_of_view(entry_value, bound, player)
+            if bound == EXACT:
+                return entry_value, hash_move
+            elif bound == LOWER_BOUND:
+                alpha = max(alpha, entry_value)
+            else:
+                beta = min(beta, entry_value)
+            if alpha >= beta:
+                return entry_value, hash_move
+
+    if depth == 0 or len(state.legal_moves) == 0:
+        value = evaluate(state, context.evaluation_cache)[0]
+        if depth > 0:
+            stored_value = white_point_of_view(value, EXACT, player)[0]
+            store_entry(hash_map, state, depth, EXACT, stored_value, None)
+        return value, None
+
+    moves = context.ordering.order(state.legal_moves, ply, player, hash_move)
+    child_values = None
+    if depth == 1 and context.batch_evaluation and np is not None and current_evaluator() == STATIC_EVALUATOR:
+        child_values = evaluate_children(state, moves, context)
+    value = -float(inf)
+    best_move = None
+    for index, (legal_row, legal_column) in enumerate(moves):
+        if child_values is not None:
+            new_value = -child_values[index]
+        else:
+            record = state.make_move(legal_row, legal_column, player)
+            try:
+                new_node = child_node(current_node, state, ply + 1)
+                if index == 0:
+                    new_value = -negamax(state, depth - 1, hash_map, new_node, context, -beta, -alpha, ply + 1)[0]
+                else:
+                    new_value = -negamax(state, depth - 1, hash_map, new_node, context,
+                                         -nextafter(alpha, inf), -alpha, ply + 1)[0]
+                    if alpha < new_value < beta:
+                        new_value = -negamax(state, depth - 1, hash_map, new_node, context,
+                                             -beta, -alpha, ply + 1)[0]
+            finally:
+                state.unmake_move(record)
+        if new_value > value:
+            value = new_value
+            best_move = (legal_row, legal_column)
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            context.ordering.cutoff((legal_row, legal_column), ply, player, depth, index, hash_move)
+            break
+
+    if value <= alpha_original:
+        bound = UPPER_BOUND
+    elif value >= beta_original:
+        bound = LOWER_BOUND
+    else:
+        bound = EXACT
+    stored_value, stored_bound = white_point_of_view(value, bound, player)
+    store_entry(hash_map, state, depth, stored_bound, stored_value, best_move)
+    return value, best_move
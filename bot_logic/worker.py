@@ -0,0 +1,120 @@
+"""
+Module with the BotWorker class, which searches the bot's move without blocking the window.
+"""
+
+from bot_logic.bot import *
+from ctypes import c_byte
+from queue import Queue, Empty
+from threading import Thread
+from time import time
+
+
+class BotWorker(object):
+    """
+    Class BotWorker models the bot's search running in a background thread.
+
+    The search runs on a copy of the board, so the window can keep drawing the real one, and the chosen move is handed
+    over to the event loop through a queue. If the search fails, no move is handed over and the exception is kept in
+    error. The search table, the game tree and the evaluation cache are shared with
+    the rest of the game, so nothing else may search while the worker is running.
+    """
+
+    def __init__(self):
+        """
+        Constructor of the BotWorker class.
+        """
+
+        self._thread = None
+        self._stop = c_byte(0)
+        self._results = Queue()
+        self._start = None
+        self._error = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    @property
+    def start_time(self):
+        return self._start
+
+    @property
+    def error(self):
+        return self._error
+
+    def start(self, board, hash_map, current_node, evaluation_cache=None):
+        """
+        Method that starts searching the bot's move in a background thread.
+
+        :param board: Current state of the board.
+        :type board: game_structures.Board.Board
+        :param hash_map: Search table.
+        :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+        :param current_node: Current node of the tree.
+        :type current_node: data_structures.GameTree.TreeNode
+        :param evaluation_cache: Cache of leaf evaluations to reuse between moves.
+        :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+        """
+
+        self.cancel()
+        self._stop.value = 0
+        self._start = time()
+        self._error = None
+        self._thread = Thread(target=self._search, args=(board.copy(), hash_map, current_node, evaluation_cache),
+                              daemon=True)
+        self._thread.start()
+
+    def poll(self):
+        """
+        Method that returns the bot's move if the search has finished, without waiting for it.
+
+        :return: Row, column and depth of the search (None, None and 0 if there was no move or the search failed), or
+                 None if the search is still running.
+        :rtype: tuple[int, int, int] or tuple[NoneType, NoneType, int] or NoneType
+        """
+
+        if self._thread is None:
+            return None
+        try:
+            result = self._results.get_nowait()
+        except Empty:
+            return None
+        self._thread.join()
+        self._thread = None
+        return result
+
+    def cancel(self):
+        """
+        Method that stops the search, if it is running, and throws its move away.
+        """
+
+        if self._thread is None:
+            return
+        self._stop.value = 1
+        self._thread.join()
+        self._thread = None
+        while not self._results.empty():
+            self._results.get_nowait()
+
+    def _search(self, board, hash_map, current_node, evaluation_cache):
+        """
+        Private method that runs in the background thread and puts the bot's move into the queue. An exception of the
+        search is kept in error and no move is put into the queue instead, so that the event loop does not wait for
+        the move forever.
+
+        :param board: Copy of the state of the board, searched in place.
+        :type board: game_structures.Board.Board
+        :param hash_map: Search table.
+        :type hash_map: data_structures.TranspositionTable.TranspositionTable or data_structures.HashMap.HashMap
+        :param current_node: Current node of the tree.
+        :type current_node: data_structures.GameTree.TreeNode
+        :param evaluation_cache: Cache of leaf evaluations.
+        :type evaluation_cache: data_structures.EvaluationCache.EvaluationCache or NoneType
+        """
+
+        try:
+            result = bot_play(board, hash_map, current_node, evaluation_cache=evaluation_cache, stop=self._stop)
+        except Exception as error:
+            self._error = error
+            result = None, None, 0
+        self._results.put(result)
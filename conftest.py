@@ -0,0 +1,3 @@
+"""
+Configuration of the tests; keeps the root of the project importable when the tests are run with pytest.
+"""
@@ -11,3 +11,28 @@ GREY = (100, 100, 100)
 WIDTH, HEIGHT = 700, 730
 COLUMNS, ROWS = 8, 8
 SQUARE_SIZE = WIDTH // COLUMNS
+
+SQUARE_WEIGHTS = [
+    [20, -3, 11,  8,  8, 11, -3, 20],
+    [-3, -7, -4,  1,  1, -4, -7, -3],
+    [11, -4,  2,  2,  2,  2, -4, 11],
+    [+8,  1,  2, -3, -3,  2,  1,  8],
+    [+8,  1,  2, -3, -3,  2,  1,  8],
+    [11, -4,  2,  2,  2,  2, -4, 11],
+    [-3, -7, -4,  1,  1, -4, -7, -3],
+    [20, -3, 11,  8,  8, 11, -3, 20],
+]
+
+TIME_LIMIT = 2.5
+ENDGAME_EMPTIES = 12
+ENDGAME_SHARE = 0.5
+EVALUATOR = "static"
+BATCH_EVALUATION = False
+WORKERS = 1
+PARALLEL = "root_split"
+PONDER = True
+TREE_PLIES = 2
+SLICE_NODES = 64
+OPENING_BOOK = True
+SYMMETRIC_TABLE = True
+PERSISTENT_TABLE = False
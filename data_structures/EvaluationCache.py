@@ -0,0 +1,126 @@
+"""
+Implementation of the data structure EvaluationCache.
+"""
+
+from array import array
+
+
+class EvaluationCache(object):
+    """
+    Class EvaluationCache models a bounded cache of the heuristic values of leaf positions.
+
+    The cache is direct-mapped: every key has exactly one slot, chosen by its lowest bits, and a new value always
+    replaces the one in its slot. Keys, values and the mobility of the opponent are kept in preallocated arrays, so the
+    memory used is fixed when the cache is created. Hits and misses are counted. The cached values belong to the
+    evaluation whose fingerprint was last checked, and they are removed when another evaluation is checked.
+    """
+
+    def __init__(self, capacity=2 ** 16):
+        """
+        Constructor of the EvaluationCache class.
+
+        :param capacity: Maximum number of cached positions, rounded down to a power of two.
+        :type capacity: int
+        """
+
+        slots = 1
+        while 2 * slots <= capacity:
+            slots *= 2
+        self._mask = slots - 1
+        self._keys = array('Q', bytes(8 * slots))
+        self._values = array('d', bytes(8 * slots))
+        self._mobility = array('B', bytes(slots))
+        self._filled = bytearray(slots)
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._fingerprint = None
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        index = key & self._mask
+        return self._filled[index] and self._keys[index] == key
+
+    @property
+    def capacity(self):
+        return self._mask + 1
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def fingerprint(self):
+        return self._fingerprint
+
+    @property
+    def hit_rate(self):
+        probes = self._hits + self._misses
+        if probes == 0:
+            return 0.0
+        return self._hits / probes
+
+    def probe(self, key):
+        """
+        Method to look up the cached evaluation of a position.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+
+        :return: Heuristic value and number of legal moves of the opponent, or None if the position is not cached.
+        :rtype: tuple[float, int] or NoneType
+        """
+
+        index = key & self._mask
+        if self._filled[index] and self._keys[index] == key:
+            self._hits += 1
+            return self._values[index], self._mobility[index]
+        self._misses += 1
+        return None
+
+    def store(self, key, value, mobility):
+        """
+        Method to cache the evaluation of a position, replacing whatever was cached in its slot.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+        :param value: Heuristic value.
+        :type value: float
+        :param mobility: Number of legal moves of the opponent.
+        :type mobility: int
+        """
+
+        index = key & self._mask
+        if not self._filled[index]:
+            self._filled[index] = 1
+            self._size += 1
+        self._keys[index] = key
+        self._values[index] = value
+        self._mobility[index] = mobility
+
+    def clear(self):
+        """
+        Method to remove all cached positions, e.g. after the evaluation has been changed. The counters are kept.
+        """
+
+        self._filled = bytearray(len(self._filled))
+        self._size = 0
+
+    def check_fingerprint(self, fingerprint):
+        """
+        Method to make sure that the cached values were calculated by the evaluation with the given fingerprint. If
+        they were calculated by another evaluation, all cached positions are removed.
+
+        :param fingerprint: Fingerprint of the evaluation that will use the cache.
+        :type fingerprint: int
+        """
+
+        if fingerprint != self._fingerprint:
+            self.clear()
+            self._fingerprint = fingerprint
@@ -4,8 +4,9 @@ Implementation of the data structure HashMap.
 
 from data_structures.Array import *
 from data_structures.Map import *
-from random import randint, randrange
+from random import randrange
 from constants import *
+from game_structures import bitboard
 
 
 class HashMap(object):
@@ -13,19 +14,25 @@ class HashMap(object):
     Class HashMap models a hash map.
     """
 
-    def __init__(self, capacity=128):
+    def __init__(self, capacity=128, max_load_factor=0.75, symmetric=False):
         """
         Constructor of the HashMap class.
 
         :param capacity: Capacity of the hash map.
         :type capacity: int
+        :param max_load_factor: Load factor above which the hash map doubles its capacity.
+        :type max_load_factor: float
+        :param symmetric: Whether the search stores positions under their canonical keys, so that symmetric positions
+                          share one entry.
+        :type symmetric: bool
         """
 
         self._table = DynamicArray(capacity)
         self._size = 0
         self._capacity = self._table.capacity
+        self._max_load_factor = max_load_factor
+        self._symmetric = symmetric
         self._init_buckets()
-        self._board_values = self._init_table()
 
         self.prime = 109345121
         self._a = 1 + randrange(self.prime-1)
@@ -34,6 +41,22 @@ class HashMap(object):
     def __len__(self):
         return self._size
 
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def load_factor(self):
+        return self._size / self._capacity
+
+    @property
+    def max_load_factor(self):
+        return self._max_load_factor
+
+    @property
+    def symmetric(self):
+        return self._symmetric
+
     def __iter__(self):
         for bucket in self._table:
             if len(bucket) != 0:
@@ -47,6 +70,8 @@ class HashMap(object):
     def __setitem__(self, key, value):
         compressed_index = self._compress_key(key)
         self._bucket_setitem(compressed_index, key, value)
+        if self._size > self._capacity * self._max_load_factor:
+            self._resize(2 * self._capacity)
 
     def __delitem__(self, key):
         compressed_index = self._compress_key(key)
@@ -68,28 +93,41 @@ class HashMap(object):
         for i in range(self._capacity):
             self._table.append(Map())
 
-    def _init_table(self):
+    def reserve(self, n):
         """
-        Private method to initialize field values on the board.
+        Method that resizes the hash map in advance, so that n items can be stored without further rehashing.
 
-        :return: Table with values for each field.
-        :rtype: list
+        :param n: Expected number of items.
+        :type n: int
         """
 
-        table = []
-        for i in range(8):
-            column = []
-            for j in range(8):
-                numbers = []
-                for k in range(2):
-                    numbers.append(randint(0, 255))
-                column.append(numbers)
-            table.append(column)
-        return table
+        capacity = self._capacity
+        while n > capacity * self._max_load_factor:
+            capacity *= 2
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+    def _resize(self, new_capacity):
+        """
+        Private method that rehashes all items into a larger array of buckets.
+
+        :param new_capacity: New number of buckets.
+        :type new_capacity: int
+        """
+
+        old_table = self._table
+        self._table = DynamicArray(new_capacity)
+        self._capacity = new_capacity
+        self._init_buckets()
+        for bucket in old_table:
+            for key, value in bucket.items():
+                self._table[self._compress_key(key)][key] = value
 
     def _Zobrist_hashing(self, key):
         """
         Zobrist hashing of the key (first hashing).
+        Keys that are already Zobrist keys (e.g. Board.hash_key) are used directly, while states on the board are
+        hashed with the same 64-bit table that the Board uses.
 
         :param key: Key.
 
@@ -97,18 +135,17 @@ class HashMap(object):
         :rtype: int
         """
 
+        if isinstance(key, int):
+            return key
         hashed = 0
         for i in range(8):
             for j in range(8):
                 piece = key[i][j]
-                field = self._board_values[i][j]
                 if piece != 0:
                     if piece.color == WHITE:
-                        color = 0
+                        hashed ^= bitboard.ZOBRIST_WHITE[bitboard.square(i, j)]
                     else:
-                        color = 1
-                    table_value = field[color]
-                    hashed ^= table_value
+                        hashed ^= bitboard.ZOBRIST_BLACK[bitboard.square(i, j)]
         return hashed
 
     def _compress_key(self, key):
@@ -150,7 +187,9 @@ class HashMap(object):
         """
 
         bucket = self._table[index]
+        size = len(bucket)
         bucket[key] = value
+        self._size += len(bucket) - size
 
     def _bucket_delitem(self, index, key):
         """
@@ -166,3 +205,4 @@ class HashMap(object):
             raise KeyError("Key does not exist !")
         else:
             del bucket[key]
+            self._size -= 1
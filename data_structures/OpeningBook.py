@@ -0,0 +1,94 @@
+"""
+Implementation of the data structure OpeningBook.
+"""
+
+from mmap import mmap, ACCESS_READ
+import struct
+
+MAGIC = b"OTBK"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+# Key of the position, field of the best move, depth of the search and value of the position.
+RECORD = struct.Struct("<QBBf")
+
+
+def write_opening_book(entries, file_path):
+    """
+    Function that writes the entries of an opening book to a binary file: a header (magic, version and the number of
+    entries) followed by the entries as fixed-size little-endian records, sorted by their keys.
+
+    :param entries: Best move (index of the bit of its field), depth and value for every key.
+    :type entries: dict[int, tuple[int, int, float]]
+    :param file_path: Path of the file.
+    :type file_path: str
+    """
+
+    with open(file_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        for key in sorted(entries):
+            file.write(RECORD.pack(key, *entries[key]))
+
+
+class OpeningBook(object):
+    """
+    Class OpeningBook models a read-only opening book stored in a binary file.
+
+    The file is memory-mapped instead of read, so opening the book costs almost nothing, and the records are sorted by
+    their keys, so an entry is found with a binary search over the file.
+    """
+
+    def __init__(self, file_path):
+        """
+        Constructor of the OpeningBook class.
+
+        :param file_path: Path of the file written by write_opening_book.
+        :type file_path: str
+
+        :raises ValueError: If the file is not an opening book of this version.
+        """
+
+        with open(file_path, "rb") as file:
+            self._buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+        magic = version = size = None
+        if len(self._buffer) >= HEADER.size:
+            magic, version, size = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION or len(self._buffer) != HEADER.size + size * RECORD.size:
+            self._buffer.close()
+            raise ValueError("File is not an opening book of this version !")
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return self.probe(key) is not None
+
+    def probe(self, key):
+        """
+        Method to look up the entry for a key.
+
+        :param key: Key of the position.
+        :type key: int
+
+        :return: Best move (index of the bit of its field), depth and value, or None if the key is not in the book.
+        :rtype: tuple[int, int, float] or NoneType
+        """
+
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self._buffer, HEADER.size + middle * RECORD.size)
+            if record[0] < key:
+                low = middle + 1
+            elif record[0] > key:
+                high = middle
+            else:
+                return record[1:]
+        return None
+
+    def close(self):
+        """
+        Method that unmaps the file. The book cannot be used afterwards.
+        """
+
+        self._buffer.close()
@@ -0,0 +1,144 @@
+"""
+Implementation of the data structure SharedTranspositionTable.
+"""
+
+from data_structures.TranspositionTable import *
+from data_structures.TranspositionTable import _pack, _unpack
+from multiprocessing import shared_memory
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    Class SharedTranspositionTable models a transposition table placed in shared memory, so that several processes can
+    search with the same table at the same time.
+
+    Entries are written without locks. Instead of the key, the first word of an entry holds the key XOR-ed with the
+    other two words, so an entry that was only partly written by one process while another one was reading it does not
+    match its key and is treated as missing. The generation of the search is kept in shared memory as well. The length
+    of the table only counts the entries stored by the current process.
+    """
+
+    def __init__(self, megabytes=16, symmetric=False, name=None):
+        """
+        Constructor of the SharedTranspositionTable class.
+
+        :param megabytes: Maximum memory used by the table, in megabytes.
+        :type megabytes: int or float
+        :param symmetric: Whether the search stores positions under their canonical keys.
+        :type symmetric: bool
+        :param name: Name of the shared memory of an existing table to attach to, or None to create a new table.
+        :type name: str or NoneType
+        """
+
+        self._megabytes = megabytes
+        self._name = name
+        self._memory = None
+        self._header = None
+        super().__init__(megabytes, symmetric)
+
+    def __reduce__(self):
+        return SharedTranspositionTable, (self._megabytes, self._symmetric, self.name)
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    @property
+    def generation(self):
+        return self._header[0]
+
+    def _allocate(self, nbytes):
+        """
+        Private method that creates or attaches the shared memory. The first word holds the generation and the rest of
+        the memory holds the entries.
+
+        :param nbytes: Size of the buffer for the entries in bytes.
+        :type nbytes: int
+
+        :return: Zero-filled buffer in shared memory.
+        :rtype: memoryview
+        """
+
+        if self._name is None:
+            self._memory = shared_memory.SharedMemory(create=True, size=8 + nbytes)
+            self._memory.buf[:8 + nbytes] = bytes(8 + nbytes)
+        else:
+            self._memory = shared_memory.SharedMemory(self._name)
+        self._header = self._memory.buf[:8].cast('Q')
+        return self._memory.buf[8:8 + nbytes]
+
+    def new_search(self):
+        """
+        Method that marks the start of a new search for all processes using the table.
+        """
+
+        self._header[0] = (self._header[0] + 1) & 255
+
+    def probe(self, key):
+        """
+        Method to look up the entry for a key.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+
+        :return: Depth, bound type, score and best move, or None if the key is not in the table.
+        :rtype: tuple[int, int, float, tuple[int, int] or NoneType] or NoneType
+        """
+
+        words = self._words
+        offset = (key & self._mask) * 2 * ENTRY_WORDS
+        for offset in (offset, offset + ENTRY_WORDS):
+            meta = words[offset + 2]
+            if meta and words[offset] ^ words[offset + 1] ^ meta == key:
+                return _unpack(meta, self._scores[offset + 1])
+        return None
+
+    def store(self, key, depth, bound, score, move=None):
+        """
+        Method to store an entry, with the same replacement scheme as the TranspositionTable.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+        :param depth: Depth at which the position was searched.
+        :type depth: int
+        :param bound: Type of the bound (EXACT, LOWER_BOUND or UPPER_BOUND).
+        :type bound: int
+        :param score: Score of the position.
+        :type score: float
+        :param move: Best move found in the position.
+        :type move: tuple[int, int] or NoneType
+        """
+
+        words = self._words
+        generation = self._header[0]
+        offset = (key & self._mask) * 2 * ENTRY_WORDS
+        meta = words[offset + 2]
+        if meta and words[offset] ^ words[offset + 1] ^ meta != key and (meta >> 17) == generation \
+                and ((meta >> 2) & 255) > depth:
+            offset += ENTRY_WORDS
+            meta = words[offset + 2]
+        if not meta:
+            self._size += 1
+        meta = _pack(depth, bound, move, generation)
+        self._scores[offset + 1] = score
+        words[offset + 2] = meta
+        words[offset] = key ^ words[offset + 1] ^ meta
+
+    def close(self):
+        """
+        Method that detaches the current process from the shared memory. The table cannot be used afterwards.
+        """
+
+        self._words.release()
+        self._scores.release()
+        self._header.release()
+        self._buffer.release()
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Method that frees the shared memory once no process uses it anymore. It should be called by the process that
+        created the table.
+        """
+
+        self._memory.unlink()
@@ -0,0 +1,316 @@
+"""
+Implementation of the data structure TranspositionTable.
+"""
+
+from constants import *
+from array import array
+from mmap import mmap, ACCESS_COPY
+from os import path, replace
+from sys import byteorder
+import struct
+
+EXACT = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+NO_MOVE = ROWS * COLUMNS
+ENTRY_WORDS = 3
+ENTRY_SIZE = 8 * ENTRY_WORDS
+
+MAGIC = b"OTTT"
+VERSION = 2
+# Magic, version, whether the keys are canonical, generation, fingerprint of the evaluation, number of buckets and
+# number of entries.
+HEADER = struct.Struct("<4sHBBQQQ")
+
+
+def _pack(depth, bound, move, generation):
+    """
+    Static method that packs the scalar data of an entry into a single 64-bit word.
+
+    :param depth: Depth at which the entry was searched.
+    :type depth: int
+    :param bound: Type of the bound (EXACT, LOWER_BOUND or UPPER_BOUND).
+    :type bound: int
+    :param move: Best move or None.
+    :type move: tuple[int, int] or NoneType
+    :param generation: Generation of the search that stored the entry.
+    :type generation: int
+
+    :return: Packed word.
+    :rtype: int
+    """
+
+    if move is None:
+        square = NO_MOVE
+    else:
+        square = move[0] * COLUMNS + move[1]
+    return bound | (min(max(depth, 0), 255) << 2) | (square << 10) | (generation << 17)
+
+
+def _unpack(meta, score):
+    """
+    Static method that unpacks an entry into a tuple.
+
+    :param meta: Packed word with the depth, bound, move and generation.
+    :type meta: int
+    :param score: Score of the entry.
+    :type score: float
+
+    :return: Depth, bound type, score and best move.
+    :rtype: tuple[int, int, float, tuple[int, int] or NoneType]
+    """
+
+    square = (meta >> 10) & 127
+    if square == NO_MOVE:
+        move = None
+    else:
+        move = divmod(square, COLUMNS)
+    return (meta >> 2) & 255, meta & 3, score, move
+
+
+class TranspositionTable(object):
+    """
+    Class TranspositionTable models a bounded transposition table with open addressing.
+
+    All entries are kept in a single preallocated buffer of 64-bit words (key, score, packed depth/bound/move), so the
+    memory used is fixed when the table is created. Each key maps to a bucket of two neighbouring slots: the first one
+    keeps the deepest entry of the current search, and the second one is always replaced.
+    """
+
+    def __init__(self, megabytes=16, symmetric=False, buffer=None, fingerprint=0):
+        """
+        Constructor of the TranspositionTable class.
+
+        :param megabytes: Maximum memory used by the table, in megabytes.
+        :type megabytes: int or float
+        :param symmetric: Whether the search stores positions under their canonical keys, so that symmetric positions
+                          share one entry.
+        :type symmetric: bool
+        :param buffer: Existing buffer with the entries (e.g. a memory-mapped file) whose size is used instead of
+                       megabytes, or None to allocate a new buffer.
+        :type buffer: bytearray or memoryview or NoneType
+        :param fingerprint: Fingerprint of the evaluation that the scores come from, saved with the table.
+        :type fingerprint: int
+        """
+
+        buckets = 1
+        if buffer is not None:
+            megabytes = len(buffer) / 2 ** 20
+        while 2 * buckets * 2 * ENTRY_SIZE <= megabytes * 2 ** 20:
+            buckets *= 2
+        self._mask = buckets - 1
+        if buffer is None:
+            buffer = self._allocate(buckets * 2 * ENTRY_SIZE)
+        self._buffer = buffer
+        self._words = memoryview(self._buffer).cast('Q')
+        self._scores = memoryview(self._buffer).cast('d')
+        self._size = 0
+        self._generation = 0
+        self._symmetric = symmetric
+        self._fingerprint = fingerprint
+        self._mapping = None
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        entry = self.probe(key)
+        if entry is None:
+            raise KeyError("Key does not exist !")
+        return entry
+
+    def __setitem__(self, key, entry):
+        self.store(key, *entry)
+
+    def __contains__(self, key):
+        return self.probe(key) is not None
+
+    @property
+    def capacity(self):
+        return 2 * (self._mask + 1)
+
+    @property
+    def nbytes(self):
+        return len(self._buffer)
+
+    @property
+    def generation(self):
+        return self._generation
+
+    @property
+    def symmetric(self):
+        return self._symmetric
+
+    @property
+    def fingerprint(self):
+        return self._fingerprint
+
+    def _allocate(self, nbytes):
+        """
+        Private method that allocates the buffer for the entries.
+
+        :param nbytes: Size of the buffer in bytes.
+        :type nbytes: int
+
+        :return: Zero-filled buffer.
+        :rtype: bytearray
+        """
+
+        return bytearray(nbytes)
+
+    def new_search(self):
+        """
+        Method that marks the start of a new search, so the entries of older searches can be replaced first.
+        """
+
+        self._generation = (self._generation + 1) & 255
+
+    def clear(self):
+        """
+        Method to clear all entries from the table.
+        """
+
+        self._buffer[:] = bytes(len(self._buffer))
+        self._size = 0
+
+    def probe(self, key):
+        """
+        Method to look up the entry for a key.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+
+        :return: Depth, bound type, score and best move, or None if the key is not in the table.
+        :rtype: tuple[int, int, float, tuple[int, int] or NoneType] or NoneType
+        """
+
+        words = self._words
+        offset = (key & self._mask) * 2 * ENTRY_WORDS
+        if words[offset] == key and words[offset + 2]:
+            return _unpack(words[offset + 2], self._scores[offset + 1])
+        offset += ENTRY_WORDS
+        if words[offset] == key and words[offset + 2]:
+            return _unpack(words[offset + 2], self._scores[offset + 1])
+        return None
+
+    def store(self, key, depth, bound, score, move=None):
+        """
+        Method to store an entry. The deep slot of the bucket is only replaced by an entry of the same key, an entry
+        searched at least as deep, or when it belongs to an older search; otherwise the entry goes to the
+        always-replace slot.
+
+        :param key: Zobrist key of the position.
+        :type key: int
+        :param depth: Depth at which the position was searched.
+        :type depth: int
+        :param bound: Type of the bound (EXACT, LOWER_BOUND or UPPER_BOUND).
+        :type bound: int
+        :param score: Score of the position.
+        :type score: float
+        :param move: Best move found in the position.
+        :type move: tuple[int, int] or NoneType
+        """
+
+        words = self._words
+        offset = (key & self._mask) * 2 * ENTRY_WORDS
+        meta = words[offset + 2]
+        if meta and words[offset] != key and (meta >> 17) == self._generation and ((meta >> 2) & 255) > depth:
+            offset += ENTRY_WORDS
+            meta = words[offset + 2]
+        if not meta:
+            self._size += 1
+        words[offset] = key
+        self._scores[offset + 1] = score
+        words[offset + 2] = _pack(depth, bound, move, self._generation)
+
+    def save(self, file_path):
+        """
+        Method that writes the table to a binary file: a header (magic, version, whether the keys are canonical, the
+        generation, the fingerprint of the evaluation, the number of buckets and the number of entries) followed by the
+        entries as little-endian 64-bit words. The file is written next to its final path and then moved over it. A
+        table that is memory-mapped from a file is copied into memory and unmapped first, because a mapped file cannot
+        be replaced on every platform.
+
+        :param file_path: Path of the file.
+        :type file_path: str
+        """
+
+        temporary_path = file_path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self._symmetric, self._generation, self._fingerprint,
+                                   self._mask + 1, self._size))
+            if byteorder == "big":
+                words = array('Q', self._words)
+                words.byteswap()
+                words.tofile(file)
+            else:
+                file.write(self._buffer)
+        self.unmap()
+        replace(temporary_path, file_path)
+
+    def unmap(self):
+        """
+        Method that copies the entries of a memory-mapped table into memory and closes the mapping of the file, so the
+        file can be replaced or deleted while the table is still used. It does nothing for other tables.
+        """
+
+        if self._mapping is None:
+            return
+        buffer = bytearray(self._buffer)
+        self._words.release()
+        self._scores.release()
+        self._buffer.release()
+        self._mapping.close()
+        self._mapping = None
+        self._buffer = buffer
+        self._words = memoryview(self._buffer).cast('Q')
+        self._scores = memoryview(self._buffer).cast('d')
+
+
+def load_transposition_table(file_path, memory_map=False, fingerprint=None):
+    """
+    Function that reads a table written by TranspositionTable.save.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param memory_map: Whether the file is memory-mapped instead of read, so only the parts of the table that the
+                       search touches are loaded. Changes of a memory-mapped table are not written back to the file,
+                       and the mapping is closed by TranspositionTable.unmap.
+    :type memory_map: bool
+    :param fingerprint: Fingerprint of the current evaluation, or None to accept a table of any evaluation.
+    :type fingerprint: int or NoneType
+
+    :return: Loaded table.
+    :rtype: TranspositionTable
+
+    :raises ValueError: If the file is not a transposition table of this version, or its scores come from another
+                        evaluation.
+    """
+
+    mapping = None
+    with open(file_path, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError("File is not a transposition table of this version !")
+        magic, version, symmetric, generation, table_fingerprint, buckets, size = HEADER.unpack(header)
+        nbytes = buckets * 2 * ENTRY_SIZE
+        if magic != MAGIC or version != VERSION or path.getsize(file_path) != HEADER.size + nbytes:
+            raise ValueError("File is not a transposition table of this version !")
+        if fingerprint is not None and table_fingerprint != fingerprint:
+            raise ValueError("Table was saved with another evaluation !")
+        if memory_map and byteorder == "little":
+            mapping = mmap(file.fileno(), 0, access=ACCESS_COPY)
+            buffer = memoryview(mapping)[HEADER.size:]
+        else:
+            buffer = bytearray(nbytes)
+            file.readinto(buffer)
+            if byteorder == "big":
+                words = array('Q', buffer)
+                words.byteswap()
+                buffer = bytearray(words.tobytes())
+    table = TranspositionTable(symmetric=bool(symmetric), buffer=buffer, fingerprint=table_fingerprint)
+    table._mapping = mapping
+    table._generation = generation
+    table._size = size
+    return table
@@ -3,11 +3,126 @@ Module with the Board class.
 """
 
 from game_structures.Piece import *
+from game_structures import bitboard
+from game_structures import patterns
+
+
+class UndoRecord(object):
+    """
+    Class UndoRecord models everything needed to take back a move played on the board.
+    """
+
+    def __init__(self, row, column, color, flipped, black, white, playing, legal_bits, legal_moves, old_legal_moves,
+                 hash_key, symmetric_keys, evaluation):
+        """
+        Constructor of the UndoRecord class.
+
+        :param row: Row of the placed piece.
+        :type row: int
+        :param column: Column of the placed piece.
+        :type column: int
+        :param color: Color of the placed piece.
+        :type color: tuple[int, int, int]
+        :param flipped: Bitboard of the flipped pieces.
+        :type flipped: int
+        :param black: Number of black pieces before the move.
+        :type black: int
+        :param white: Number of white pieces before the move.
+        :type white: int
+        :param playing: Player on the move before the move.
+        :type playing: tuple[int, int, int]
+        :param legal_bits: Bitboard of the legal moves before the move.
+        :type legal_bits: int
+        :param legal_moves: Legal moves before the move.
+        :type legal_moves: list or NoneType
+        :param old_legal_moves: Number of legal moves preceding the ones before the move.
+        :type old_legal_moves: int
+        :param hash_key: Zobrist key before the move.
+        :type hash_key: int
+        :param symmetric_keys: Packed Zobrist keys of the symmetric images of the position before the move.
+        :type symmetric_keys: int
+        :param evaluation: Weights and frontiers of the black and white pieces and pattern indices before the move.
+        :type evaluation: tuple[int, int, int, int, list]
+        """
+
+        self._row = row
+        self._column = column
+        self._color = color
+        self._flipped = flipped
+        self._black = black
+        self._white = white
+        self._playing = playing
+        self._legal_bits = legal_bits
+        self._legal_moves = legal_moves
+        self._old_legal_moves = old_legal_moves
+        self._hash_key = hash_key
+        self._symmetric_keys = symmetric_keys
+        self._evaluation = evaluation
+
+    @property
+    def row(self):
+        return self._row
+
+    @property
+    def column(self):
+        return self._column
+
+    @property
+    def color(self):
+        return self._color
+
+    @property
+    def flipped(self):
+        return self._flipped
+
+    @property
+    def black(self):
+        return self._black
+
+    @property
+    def white(self):
+        return self._white
+
+    @property
+    def playing(self):
+        return self._playing
+
+    @property
+    def legal_bits(self):
+        return self._legal_bits
+
+    @property
+    def legal_moves(self):
+        return self._legal_moves
+
+    @property
+    def old_legal_moves(self):
+        return self._old_legal_moves
+
+    @property
+    def hash_key(self):
+        return self._hash_key
+
+    @property
+    def symmetric_keys(self):
+        return self._symmetric_keys
+
+    @property
+    def evaluation(self):
+        return self._evaluation
 
 
 class Board(object):
     """
     Class Board models the current state of the board.
+
+    The pieces are kept in two bitboards (one 64-bit integer for each color), while the list of Piece objects returned
+    by the state property is only built when it is needed for displaying the board. The terms used by the heuristics
+    (the sum of the field weights, the number of empty neighbouring fields of each color and the ternary indices of
+    the patterns) are updated on every move, so they do not have to be recalculated from the whole board.
+
+    Besides the initial position, a board can be created from any position with from_bits or from_string, and copied
+    cheaply with copy.
     """
 
     def __init__(self, mode, state=None):
@@ -20,30 +135,139 @@ class Board(object):
         :type state: list
         """
 
-        if state is None:
-            self._state = []
+        self._mode = mode
+        self._black_bits = 0
+        self._white_bits = 0
+        self._state = None
+        if state:
+            self._load_pieces(state)
         else:
-            self._state = state
+            self._create_pieces()
+        self._init_position(BLACK)
 
-        self._mode = mode
-        self._create_pieces()
-        self._white = 2
-        self._black = 2
+    @classmethod
+    def from_bits(cls, black, white, playing=BLACK, mode=1):
+        """
+        Alternate constructor that creates a board with the given position.
+
+        :param black: Bitboard of the black pieces.
+        :type black: int
+        :param white: Bitboard of the white pieces.
+        :type white: int
+        :param playing: Player on the move.
+        :type playing: tuple[int, int, int]
+        :param mode: Game mode.
+        :type mode: int
+
+        :return: Board with the position.
+        :rtype: Board
+
+        :raises ValueError: If the bitboards overlap or do not fit into 64 bits.
+        """
+
+        if black & white or (black | white) & ~bitboard.FULL or black < 0 or white < 0:
+            raise ValueError("Invalid position !")
+        board = cls.__new__(cls)
+        board._mode = mode
+        board._black_bits = black
+        board._white_bits = white
+        board._state = None
+        board._init_position(playing)
+        return board
+
+    @classmethod
+    def from_string(cls, string, mode=1):
+        """
+        Alternate constructor that creates a board from a string of 64 fields in row-major order, optionally followed
+        by the player on the move. Black pieces are written as X, B or *, white pieces as O or W, and empty fields as
+        dashes or dots. Whitespace is ignored, and if the player on the move is missing, black is on the move.
+
+        :param string: Position, e.g. 27 dashes, "OX", 6 dashes, "XO" and 27 dashes for the initial position.
+        :type string: str
+        :param mode: Game mode.
+        :type mode: int
+
+        :return: Board with the position.
+        :rtype: Board
+
+        :raises ValueError: If the string is not a valid position.
+        """
+
+        fields = "".join(string.split()).upper()
+        if len(fields) not in (ROWS * COLUMNS, ROWS * COLUMNS + 1):
+            raise ValueError("Invalid position !")
+        black = white = 0
+        for index, field in enumerate(fields[:ROWS * COLUMNS]):
+            if field in "XB*":
+                black |= 1 << index
+            elif field in "OW":
+                white |= 1 << index
+            elif field not in "-.":
+                raise ValueError("Invalid position !")
+        playing = BLACK
+        if len(fields) > ROWS * COLUMNS:
+            if fields[-1] in "OW":
+                playing = WHITE
+            elif fields[-1] not in "XB*":
+                raise ValueError("Invalid position !")
+        return cls.from_bits(black, white, playing, mode)
+
+    def _init_position(self, playing):
+        """
+        Private method that calculates everything derived from the bitboards: the number of pieces, the terms of the
+        heuristics, the keys and the legal moves of the player on the move.
 
+        :param playing: Player on the move.
+        :type playing: tuple[int, int, int]
+        """
+
+        self._white = bitboard.popcount(self._white_bits)
+        self._black = bitboard.popcount(self._black_bits)
+        self._black_weight = 0
+        self._white_weight = 0
+        self._black_frontier = 0
+        self._white_frontier = 0
+        self._patterns = []
+        self._init_evaluation()
+
+        self._legal_bits = 0
         self._legal_moves = []
         self._old_legal_moves = 0
-        self._playing = BLACK
-        self.all_legal_moves(BLACK)
+        self._playing = playing
+        self._hash_key = bitboard.zobrist_key(self._black_bits, self._white_bits, self._playing)
+        self._symmetric_keys = bitboard.symmetric_keys(self._black_bits, self._white_bits, self._playing)
+        self.all_legal_moves(playing)
 
     def __eq__(self, other):
-        return self._state == other.state
+        return self._black_bits == other.black_bits and self._white_bits == other.white_bits
+
+    def copy(self):
+        """
+        Method that copies the board. Only the attributes are copied: the pattern indices are never changed in place,
+        so the copy can share them, and the list of legal moves and the pieces for displaying are built again when
+        they are needed.
+
+        :return: Copy of the board.
+        :rtype: Board
+        """
+
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board._state = None
+        board._legal_moves = None
+        return board
+
+    def __getstate__(self):
+        attributes = self.__dict__.copy()
+        attributes["_state"] = None
+        return attributes
 
     def __str__(self):
         string = "\n    0   1   2   3   4   5   6   7   \n"
         for row in range(ROWS):
             string += f"{row} |"
             for column in range(COLUMNS):
-                data = self._state[row][column]
+                data = self.state[row][column]
                 if data == 0:
                     string += "   |"
                 elif data.color == BLACK:
@@ -55,8 +279,38 @@ class Board(object):
 
     @property
     def state(self):
+        if self._state is None:
+            self._state = self._build_pieces()
         return self._state
 
+    @property
+    def black_bits(self):
+        return self._black_bits
+
+    @property
+    def white_bits(self):
+        return self._white_bits
+
+    @property
+    def legal_bits(self):
+        return self._legal_bits
+
+    @property
+    def hash_key(self):
+        return self._hash_key
+
+    @property
+    def signature(self):
+        return self._black_bits | self._white_bits << 64
+
+    @property
+    def symmetric_keys(self):
+        return self._symmetric_keys
+
+    @property
+    def canonical_key(self):
+        return bitboard.smallest_key(self._symmetric_keys)
+
     @property
     def white(self):
         return self._white
@@ -65,17 +319,42 @@ class Board(object):
     def black(self):
         return self._black
 
+    @property
+    def white_weight(self):
+        return self._white_weight
+
+    @property
+    def black_weight(self):
+        return self._black_weight
+
+    @property
+    def white_frontier(self):
+        return self._white_frontier
+
+    @property
+    def black_frontier(self):
+        return self._black_frontier
+
+    @property
+    def patterns(self):
+        return self._patterns
+
     @property
     def future_legal_moves(self):
         return self._old_legal_moves
 
     @property
     def legal_moves(self):
+        if self._legal_moves is None:
+            self._legal_moves = [bitboard.position(index) for index in bitboard.squares(self._legal_bits)]
         return self._legal_moves
 
     @legal_moves.setter
     def legal_moves(self, new_value):
         self._legal_moves = new_value
+        self._legal_bits = 0
+        for row, column in new_value:
+            self._legal_bits |= 1 << bitboard.square(row, column)
 
     @property
     def playing(self):
@@ -86,17 +365,57 @@ class Board(object):
         Private method that creates the initial state of the board.
         """
 
-        for i in range(ROWS):
-            self._state.append([])
-            for j in range(COLUMNS):
-                if i in range(3, 5) and j in range(3, 5):
-                    if i == j:
-                        color = WHITE
-                    else:
-                        color = BLACK
-                    self._state[i].append(Piece(i, j, color, self._mode))
+        self._black_bits = bitboard.INITIAL_BLACK
+        self._white_bits = bitboard.INITIAL_WHITE
+
+    def _load_pieces(self, state):
+        """
+        Private method that fills the bitboards from a given state of the board.
+
+        :param state: State on the board.
+        :type state: list
+        """
+
+        for row in range(ROWS):
+            for column in range(COLUMNS):
+                piece = state[row][column]
+                if piece == 0:
+                    continue
+                if piece.color == BLACK:
+                    self._black_bits |= 1 << bitboard.square(row, column)
                 else:
-                    self._state[i].append(0)
+                    self._white_bits |= 1 << bitboard.square(row, column)
+
+    def _init_evaluation(self):
+        """
+        Private method that calculates the weights and frontiers of both colors and the pattern indices from scratch.
+        """
+
+        empty = ~(self._black_bits | self._white_bits) & bitboard.FULL
+        self._black_weight = sum(bitboard.WEIGHTS[index] for index in bitboard.squares(self._black_bits))
+        self._white_weight = sum(bitboard.WEIGHTS[index] for index in bitboard.squares(self._white_bits))
+        self._black_frontier = sum(bitboard.popcount(bitboard.NEIGHBOURS[index] & empty)
+                                   for index in bitboard.squares(self._black_bits))
+        self._white_frontier = sum(bitboard.popcount(bitboard.NEIGHBOURS[index] & empty)
+                                   for index in bitboard.squares(self._white_bits))
+        self._patterns = patterns.pattern_indices(self._black_bits, self._white_bits)
+
+    def _build_pieces(self):
+        """
+        Private method that creates Piece objects for all the pieces on the bitboards.
+
+        :return: State on the board.
+        :rtype: list
+        """
+
+        state = [[0] * COLUMNS for _ in range(ROWS)]
+        for index in bitboard.squares(self._black_bits):
+            row, column = bitboard.position(index)
+            state[row][column] = Piece(row, column, BLACK, self._mode)
+        for index in bitboard.squares(self._white_bits):
+            row, column = bitboard.position(index)
+            state[row][column] = Piece(row, column, WHITE, self._mode)
+        return state
 
     def _draw_fields(self, window):
         """
@@ -123,7 +442,7 @@ class Board(object):
         self._draw_fields(window)
         for row in range(ROWS):
             for col in range(COLUMNS):
-                piece = self._state[row][col]
+                piece = self.state[row][col]
                 if piece != 0:
                     piece.draw_piece(window)
 
@@ -135,150 +454,119 @@ class Board(object):
         :type color: tuple[int, int, int]
         """
 
-        moves = []
-        for row in range(ROWS):
-            for col in range(COLUMNS):
-                if self._state[row][col] != 0:
-                    continue
-                elif self._legal_directions(row, col, color):
-                    moves.append((row, col))
-        self._old_legal_moves = len(self._legal_moves)
-        self._legal_moves = moves
-
-    def _legal_directions(self, row, column, color):
-        """
-        Private method that calculates all legal moves for the current state of the board in all directions.
-
-        :param row: Row.
-        :type row: int
-        :param column: Column.
-        :type column: int
-        :param color: Color of the player for whom to find legal moves.
-        :type color: tuple[int, int, int]
-
-        :return: True if a move can be played on the given square, False otherwise.
-        :rtype: bool
-        """
-
-        north_west = self._legal_one_direction(row, -1, column, -1, color)
-        north = self._legal_one_direction(row, -1, column, 0, color)
-        north_east = self._legal_one_direction(row, -1, column, 1, color)
-        east = self._legal_one_direction(row, 0, column, 1, color)
-        south_east = self._legal_one_direction(row, 1, column, 1, color)
-        south = self._legal_one_direction(row, 1, column, 0, color)
-        south_west = self._legal_one_direction(row, 1, column, -1, color)
-        west = self._legal_one_direction(row, 0, column, -1, color)
-
-        if north_west or north or north_east or east or south_east or south or south_west or west:
-            return True
+        if color == BLACK:
+            moves = bitboard.legal_moves(self._black_bits, self._white_bits)
+        else:
+            moves = bitboard.legal_moves(self._white_bits, self._black_bits)
+        self._old_legal_moves = bitboard.popcount(self._legal_bits)
+        self._legal_bits = moves
+        self._legal_moves = None
 
-    def _legal_one_direction(self, y, dy, x, dx, color):
+    def mobility(self):
         """
-        Private method that calculates all legal moves for the current state of the board in a single direction.
-
-        :param y: Horizontal position.
-        :type y: int
-        :param dy: Horizontal shift.
-        :type dy: int
-        :param x: Vertical position.
-        :type x: int
-        :param dx: Vertical shift.
-        :type dx: int
-        :param color: Color of the player for whom to find legal moves.
-        :type color: tuple[int, int, int]
+        Method that counts the legal moves of both players in the current state, without making any move.
 
-        :return: True if a move can be played in the given direction, False otherwise.
-        :rtype: bool
+        :return: Number of legal moves of the player on the move and number of legal moves of the opponent.
+        :rtype: tuple[int, int]
         """
 
-        if self._on_edge(x, dx) or self._on_edge(y, dy) or self._on_edge(x, 2*dx) or self._on_edge(y, 2*dy):
-            return False
-        if self._state[y + dy][x + dx] != 0:
-            if self._state[y + dy][x + dx].color == color:
-                return False
-        if self._state[y + dy][x + dx] == 0:
-            return False
-        return self._encapsulating_opponent(y + 2 * dy, dy, x + 2 * dx, dx, color)
+        if self._playing == BLACK:
+            opponent_moves = bitboard.legal_moves(self._white_bits, self._black_bits)
+        else:
+            opponent_moves = bitboard.legal_moves(self._black_bits, self._white_bits)
+        return bitboard.popcount(self._legal_bits), bitboard.popcount(opponent_moves)
 
-    def _encapsulating_opponent(self, y, dy, x, dx, color):
+    def insert(self, row, column, color):
         """
-        Private method that checks if the opponent is encapsulated by a move.
+        Method for inserting a new piece into the current state. If the insertion is successful, the move will be
+        played; otherwise, it won't.
 
-        :param y: Horizontal position.
-        :type y: int
-        :param dy: Horizontal shift.
-        :type dy: int
-        :param x: Vertical position.
-        :type x: int
-        :param dx: Vertical shift.
-        :type dx: int
+        :param row: Row.
+        :type row: int
+        :param column: Column.
+        :type column: int
         :param color: Color of the player for whom to find legal moves.
         :type color: tuple[int, int, int]
 
-        :return: True if the opponent is encapsulated, False otherwise.
-        :rtype: bool
-        """
-
-        if self._state[y][x] == 0:
-            return False
-        if self._state[y][x] != 0:
-            if self._state[y][x].color == color:
-                return True
-
-        if self._on_edge(x, dx) or self._on_edge(y, dy):
-            return False
-
-        return self._encapsulating_opponent(y + dy, dy, x + dx, dx, color)
-
-    def _on_edge(self, a, da):
-        """
-        Private method that checks if a position is near the edges of the board.
-
-        :param a: Position.
-        :type a: int
-        :param da: Shift.
-        :type da: int
-
-        :return: True if the position is near the board edge, False otherwise.
+        :return: True if the move was played, False otherwise.
         :rtype: bool
         """
 
-        return a + da < 0 or a + da > 7
+        return self.make_move(row, column, color) is not None
 
-    def insert(self, row, column, color):
+    def make_move(self, row, column, color):
         """
-        Method for inserting a new piece into the current state. If the insertion is successful, the move will be
-        played; otherwise, it won't.
+        Method that plays a move in place and remembers how to take it back.
 
         :param row: Row.
         :type row: int
         :param column: Column.
         :type column: int
-        :param color: Color of the player for whom to find legal moves.
+        :param color: Color of the player making the move.
         :type color: tuple[int, int, int]
 
-        :return: True if the move was played, False otherwise.
-        :rtype: bool
+        :return: Undo record of the move if it was played, None otherwise.
+        :rtype: UndoRecord or NoneType
+        """
+
+        if not (0 <= row < ROWS and 0 <= column < COLUMNS):
+            return None
+        move = 1 << bitboard.square(row, column)
+        if not self._legal_bits & move:
+            return None
+        black, white, hash_key, symmetric_keys = self._black, self._white, self._hash_key, self._symmetric_keys
+        evaluation = self._black_weight, self._white_weight, self._black_frontier, self._white_frontier, self._patterns
+        flipped = self._flip_opponent(row, column, color)
+        record = UndoRecord(row, column, color, flipped, black, white, self._playing, self._legal_bits,
+                            self._legal_moves, self._old_legal_moves, hash_key, symmetric_keys, evaluation)
+        if self._playing == WHITE:
+            self._hash_key ^= bitboard.ZOBRIST_WHITE_PLAYING
+            self._symmetric_keys ^= bitboard.SYMMETRIC_WHITE_PLAYING
+        if color == WHITE:
+            self._white_bits |= move
+            self._white += 1
+            self._playing = BLACK
+            self._hash_key ^= bitboard.ZOBRIST_WHITE[bitboard.square(row, column)]
+            self._symmetric_keys ^= bitboard.SYMMETRIC_WHITE[bitboard.square(row, column)]
+        else:
+            self._black_bits |= move
+            self._black += 1
+            self._playing = WHITE
+            self._hash_key ^= bitboard.ZOBRIST_BLACK[bitboard.square(row, column)] ^ bitboard.ZOBRIST_WHITE_PLAYING
+            self._symmetric_keys ^= bitboard.SYMMETRIC_BLACK[bitboard.square(row, column)] \
+                ^ bitboard.SYMMETRIC_WHITE_PLAYING
+        self._update_evaluation(bitboard.square(row, column), flipped, color)
+        self._state = None
+        self.all_legal_moves(self._playing)
+        return record
+
+    def unmake_move(self, record):
+        """
+        Method that takes back a move played with make_move, restoring the board in place.
+
+        :param record: Undo record of the last played move.
+        :type record: UndoRecord
         """
 
-        new = Piece(row, column, color, self._mode)
-        try:
-            field = self._state[row][column]
-        except IndexError:
-            return False
-        if field == 0 and (row, column) in self._legal_moves:
-            self._state[row][column] = new
-            self._flip_opponent(row, column, color)
-            if color == WHITE:
-                self._white += 1
-                self._playing = BLACK
-            else:
-                self._black += 1
-                self._playing = WHITE
-            self.all_legal_moves(self._playing)
-            return True
+        move = 1 << bitboard.square(record.row, record.column)
+        flipped = record.flipped
+        if record.color == WHITE:
+            self._white_bits ^= move | flipped
+            self._black_bits |= flipped
         else:
-            return False
+            self._black_bits ^= move | flipped
+            self._white_bits |= flipped
+        self._black = record.black
+        self._white = record.white
+        self._playing = record.playing
+        self._legal_bits = record.legal_bits
+        self._legal_moves = record.legal_moves
+        self._old_legal_moves = record.old_legal_moves
+        self._hash_key = record.hash_key
+        self._symmetric_keys = record.symmetric_keys
+        self._black_weight, self._white_weight, self._black_frontier, self._white_frontier, self._patterns = \
+            record.evaluation
+        self._state = None
 
     def _flip_opponent(self, row, column, color):
         """
@@ -290,51 +578,78 @@ class Board(object):
         :type column: int
         :param color: Color of the player for whom to find legal moves.
         :type color: tuple[int, int, int]
-        """
-
-        self._flip_opponent_line(row, -1, column, -1, color)
-        self._flip_opponent_line(row, -1, column, 0, color)
-        self._flip_opponent_line(row, -1, column, 1, color)
-        self._flip_opponent_line(row, 0, column, 1, color)
-        self._flip_opponent_line(row, 1, column, 1, color)
-        self._flip_opponent_line(row, 1, column, 0, color)
-        self._flip_opponent_line(row, 1, column, -1, color)
-        self._flip_opponent_line(row, 0, column, -1, color)
 
-    def _flip_opponent_line(self, y, dy, x, dx, color):
+        :return: Bitboard of the flipped pieces.
+        :rtype: int
         """
-        Private method for flipping opponent's pieces in a single direction after a move is played.
 
-        :param y: Horizontal position.
-        :type y: int
-        :param dy: Horizontal shift.
-        :type dy: int
-        :param x: Vertical position.
-        :type x: int
-        :param dx: Vertical shift.
-        :type dx: int
-        :param color: Color of the player for whom to find legal moves.
+        move = 1 << bitboard.square(row, column)
+        if color == WHITE:
+            flipped = bitboard.flips(move, self._white_bits, self._black_bits)
+            self._white_bits |= flipped
+            self._black_bits ^= flipped
+            count = bitboard.popcount(flipped)
+            self._white += count
+            self._black -= count
+        else:
+            flipped = bitboard.flips(move, self._black_bits, self._white_bits)
+            self._black_bits |= flipped
+            self._white_bits ^= flipped
+            count = bitboard.popcount(flipped)
+            self._black += count
+            self._white -= count
+        for index in bitboard.squares(flipped):
+            self._hash_key ^= bitboard.ZOBRIST_FLIP[index]
+            self._symmetric_keys ^= bitboard.SYMMETRIC_FLIP[index]
+        return flipped
+
+    def _update_evaluation(self, index, flipped, color):
+        """
+        Private method that updates the weights and frontiers of both colors and the pattern indices after a move is
+        played. The indices are copied before they are changed, because the undo record keeps the old list.
+
+        :param index: Index of the bit of the placed piece.
+        :type index: int
+        :param flipped: Bitboard of the flipped pieces.
+        :type flipped: int
+        :param color: Color of the player who made the move.
         :type color: tuple[int, int, int]
-
-        :return: True if opponent's pieces were flipped, False otherwise.
-        :rtype: bool
         """
 
-        if self._on_edge(x, dx) or self._on_edge(y, dy):
-            return False
-        if self._state[y + dy][x + dx] == 0:
-            return False
-        if self._state[y + dy][x + dx].color == color:
-            return True
-
-        if self._flip_opponent_line(y + dy, dy, x + dx, dx, color):
-            self._state[y + dy][x + dx].color = color
-            if color == WHITE:
-                self._white += 1
-                self._black -= 1
-            else:
-                self._white -= 1
-                self._black += 1
-            return True
+        if color == WHITE:
+            player, opponent = self._white_bits, self._black_bits
+            digit, flip_digit = patterns.WHITE_DIGIT, patterns.WHITE_DIGIT - patterns.BLACK_DIGIT
+        else:
+            player, opponent = self._black_bits, self._white_bits
+            digit, flip_digit = patterns.BLACK_DIGIT, patterns.BLACK_DIGIT - patterns.WHITE_DIGIT
+        empty = ~(player | opponent) & bitboard.FULL
+        neighbours = bitboard.NEIGHBOURS[index]
+        indices = self._patterns[:]
+        for instance, power in patterns.SQUARE_INSTANCES[index]:
+            indices[instance] += digit * power
+
+        # Flipped pieces take their weight and their empty neighbours over to the player.
+        weight = 0
+        frontier = 0
+        for flipped_index in bitboard.squares(flipped):
+            weight += bitboard.WEIGHTS[flipped_index]
+            frontier += bitboard.popcount(bitboard.NEIGHBOURS[flipped_index] & empty)
+            for instance, power in patterns.SQUARE_INSTANCES[flipped_index]:
+                indices[instance] += flip_digit * power
+        self._patterns = indices
+        # The placed piece adds its own empty neighbours, and every piece around it loses one.
+        player_weight = bitboard.WEIGHTS[index] + weight
+        player_frontier = frontier + bitboard.popcount(neighbours & empty) \
+            - bitboard.popcount(neighbours & player & ~flipped)
+        opponent_frontier = frontier + bitboard.popcount(neighbours & (opponent | flipped))
+
+        if color == WHITE:
+            self._white_weight += player_weight
+            self._black_weight -= weight
+            self._white_frontier += player_frontier
+            self._black_frontier -= opponent_frontier
         else:
-            return False
+            self._black_weight += player_weight
+            self._white_weight -= weight
+            self._black_frontier += player_frontier
+            self._white_frontier -= opponent_frontier
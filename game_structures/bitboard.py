@@ -0,0 +1,384 @@
+"""
+Module with helper functions for the bitboard representation of the board.
+
+The board is stored as two 64-bit integers, one for each color. The field (row, column) is represented by the bit
+row * 8 + column, so shifting a bitboard by 1 moves every piece one column to the east and shifting it by 8 moves
+every piece one row to the south.
+"""
+
+from constants import *
+from random import Random
+import struct
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_FIRST_COLUMN = 0xFEFEFEFEFEFEFEFE
+NOT_LAST_COLUMN = 0x7F7F7F7F7F7F7F7F
+
+# Shift amounts and masks that prevent pieces from wrapping around the edge of the board.
+# Left shifts move pieces to the east, south-west, south and south-east.
+LEFT_SHIFTS = ((1, NOT_FIRST_COLUMN), (7, NOT_LAST_COLUMN), (8, FULL), (9, NOT_FIRST_COLUMN))
+# Right shifts move pieces to the west, north-east, north and north-west.
+RIGHT_SHIFTS = ((1, NOT_LAST_COLUMN), (7, NOT_FIRST_COLUMN), (8, FULL), (9, NOT_LAST_COLUMN))
+
+INITIAL_BLACK = (1 << 28) | (1 << 35)
+INITIAL_WHITE = (1 << 27) | (1 << 36)
+
+# Static weight of every field, indexed by the bit of the field.
+WEIGHTS = tuple(SQUARE_WEIGHTS[row][column] for row in range(ROWS) for column in range(COLUMNS))
+# Bitboard of the (up to eight) neighbouring fields of every field.
+NEIGHBOURS = tuple(
+    sum(1 << ((row + x) * COLUMNS + column + y) for x in (-1, 0, 1) for y in (-1, 0, 1)
+        if (x or y) and 0 <= row + x < ROWS and 0 <= column + y < COLUMNS)
+    for row in range(ROWS) for column in range(COLUMNS))
+
+# Bytes with the order of their bits reversed, used to mirror every row of a bitboard at once.
+_REVERSED_BYTES = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+# Zobrist keys are drawn from a fixed seed, so the same position has the same key in every process and every run.
+_zobrist_random = Random(2021)
+ZOBRIST_BLACK = tuple(_zobrist_random.getrandbits(64) for _ in range(ROWS * COLUMNS))
+ZOBRIST_WHITE = tuple(_zobrist_random.getrandbits(64) for _ in range(ROWS * COLUMNS))
+ZOBRIST_FLIP = tuple(black ^ white for black, white in zip(ZOBRIST_BLACK, ZOBRIST_WHITE))
+ZOBRIST_WHITE_PLAYING = _zobrist_random.getrandbits(64)
+
+
+def square(row, column):
+    """
+    Function that calculates the index of the bit representing a field.
+
+    :param row: Row.
+    :type row: int
+    :param column: Column.
+    :type column: int
+
+    :return: Index of the bit.
+    :rtype: int
+    """
+
+    return row * COLUMNS + column
+
+
+def position(index):
+    """
+    Function that calculates the field represented by a bit.
+
+    :param index: Index of the bit.
+    :type index: int
+
+    :return: Row and column of the field.
+    :rtype: tuple[int, int]
+    """
+
+    return divmod(index, COLUMNS)
+
+
+def popcount(bits):
+    """
+    Function that counts the pieces on a bitboard.
+
+    :param bits: Bitboard.
+    :type bits: int
+
+    :return: Number of set bits.
+    :rtype: int
+    """
+
+    return bits.bit_count()
+
+
+def squares(bits):
+    """
+    Generator of the indices of all set bits, from the lowest to the highest (row-major order of the fields).
+
+    :param bits: Bitboard.
+    :type bits: int
+
+    :return: Index of the next set bit.
+    :rtype: int
+    """
+
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def legal_moves(player, opponent):
+    """
+    Function that calculates all legal moves of a player using shift-and-mask operations.
+
+    :param player: Bitboard of the player making the move.
+    :type player: int
+    :param opponent: Bitboard of the opponent.
+    :type opponent: int
+
+    :return: Bitboard of the fields where the player can play.
+    :rtype: int
+    """
+
+    empty = ~(player | opponent) & FULL
+    moves = 0
+    for amount, mask in LEFT_SHIFTS:
+        enclosed = opponent & mask
+        line = (player << amount) & enclosed
+        line |= (line << amount) & enclosed
+        line |= (line << amount) & enclosed
+        line |= (line << amount) & enclosed
+        line |= (line << amount) & enclosed
+        line |= (line << amount) & enclosed
+        moves |= (line << amount) & mask & empty
+    for amount, mask in RIGHT_SHIFTS:
+        enclosed = opponent & mask
+        line = (player >> amount) & enclosed
+        line |= (line >> amount) & enclosed
+        line |= (line >> amount) & enclosed
+        line |= (line >> amount) & enclosed
+        line |= (line >> amount) & enclosed
+        line |= (line >> amount) & enclosed
+        moves |= (line >> amount) & mask & empty
+    return moves
+
+
+def flips(move, player, opponent):
+    """
+    Function that calculates all opponent's pieces flipped by a move.
+
+    :param move: Bitboard with the single bit of the field where the piece is placed.
+    :type move: int
+    :param player: Bitboard of the player making the move.
+    :type player: int
+    :param opponent: Bitboard of the opponent.
+    :type opponent: int
+
+    :return: Bitboard of the flipped pieces.
+    :rtype: int
+    """
+
+    flipped = 0
+    for amount, mask in LEFT_SHIFTS:
+        line = 0
+        cursor = (move << amount) & mask
+        while cursor & opponent:
+            line |= cursor
+            cursor = (cursor << amount) & mask
+        if cursor & player:
+            flipped |= line
+    for amount, mask in RIGHT_SHIFTS:
+        line = 0
+        cursor = (move >> amount) & mask
+        while cursor & opponent:
+            line |= cursor
+            cursor = (cursor >> amount) & mask
+        if cursor & player:
+            flipped |= line
+    return flipped
+
+
+def zobrist_key(black, white, playing=None):
+    """
+    Function that calculates the 64-bit Zobrist key of a position from scratch.
+
+    :param black: Bitboard of the black pieces.
+    :type black: int
+    :param white: Bitboard of the white pieces.
+    :type white: int
+    :param playing: Player on the move, or None if the key should not depend on it.
+    :type playing: tuple[int, int, int] or NoneType
+
+    :return: Zobrist key.
+    :rtype: int
+    """
+
+    key = 0
+    for index in squares(black):
+        key ^= ZOBRIST_BLACK[index]
+    for index in squares(white):
+        key ^= ZOBRIST_WHITE[index]
+    if playing == WHITE:
+        key ^= ZOBRIST_WHITE_PLAYING
+    return key
+
+
+def mirror_horizontal(bits):
+    """
+    Function that mirrors a bitboard from left to right, i.e. the field (row, column) goes to (row, 7 - column).
+
+    :param bits: Bitboard.
+    :type bits: int
+
+    :return: Mirrored bitboard.
+    :rtype: int
+    """
+
+    return int.from_bytes(bits.to_bytes(8, "little").translate(_REVERSED_BYTES), "little")
+
+
+def flip_vertical(bits):
+    """
+    Function that flips a bitboard upside down, i.e. the field (row, column) goes to (7 - row, column).
+
+    :param bits: Bitboard.
+    :type bits: int
+
+    :return: Flipped bitboard.
+    :rtype: int
+    """
+
+    return int.from_bytes(bits.to_bytes(8, "little"), "big")
+
+
+def flip_diagonal(bits):
+    """
+    Function that flips a bitboard along its main diagonal, i.e. the field (row, column) goes to (column, row).
+
+    :param bits: Bitboard.
+    :type bits: int
+
+    :return: Flipped bitboard.
+    :rtype: int
+    """
+
+    swapped = 0x0F0F0F0F00000000 & (bits ^ (bits << 28))
+    bits ^= swapped ^ (swapped >> 28)
+    swapped = 0x3333000033330000 & (bits ^ (bits << 14))
+    bits ^= swapped ^ (swapped >> 14)
+    swapped = 0x5500550055005500 & (bits ^ (bits << 7))
+    bits ^= swapped ^ (swapped >> 7)
+    return bits
+
+
+def transform(bits, symmetry):
+    """
+    Function that applies one of the 8 symmetries of the board to a bitboard. Bit 2 of the symmetry flips the board
+    along its main diagonal, then bit 1 flips it upside down and bit 0 mirrors it from left to right.
+
+    :param bits: Bitboard.
+    :type bits: int
+    :param symmetry: Symmetry, from 0 (identity) to 7.
+    :type symmetry: int
+
+    :return: Transformed bitboard.
+    :rtype: int
+    """
+
+    if symmetry & 4:
+        bits = flip_diagonal(bits)
+    if symmetry & 2:
+        bits = flip_vertical(bits)
+    if symmetry & 1:
+        bits = mirror_horizontal(bits)
+    return bits
+
+
+def transform_square(index, symmetry):
+    """
+    Function that applies one of the 8 symmetries of the board to a field.
+
+    :param index: Index of the bit of the field.
+    :type index: int
+    :param symmetry: Symmetry, from 0 (identity) to 7.
+    :type symmetry: int
+
+    :return: Index of the bit of the transformed field.
+    :rtype: int
+    """
+
+    row, column = position(index)
+    if symmetry & 4:
+        row, column = column, row
+    if symmetry & 2:
+        row = ROWS - 1 - row
+    if symmetry & 1:
+        column = COLUMNS - 1 - column
+    return square(row, column)
+
+
+# Symmetry that undoes each symmetry.
+INVERSE_SYMMETRIES = tuple(
+    next(inverse for inverse in range(8)
+         if all(transform_square(transform_square(index, symmetry), inverse) == index for index in range(64)))
+    for symmetry in range(8))
+
+
+def _symmetric_table(zobrist):
+    """
+    Private function that packs, for every field, the Zobrist keys of the field's images under all 8 symmetries into
+    one 512-bit integer, with the key for symmetry s in bits 64 * s to 64 * s + 63.
+
+    :param zobrist: Zobrist key of every field.
+    :type zobrist: tuple[int]
+
+    :return: Packed keys of every field.
+    :rtype: tuple[int]
+    """
+
+    return tuple(sum(zobrist[transform_square(index, symmetry)] << (64 * symmetry) for symmetry in range(8))
+                 for index in range(ROWS * COLUMNS))
+
+
+# Packed Zobrist keys of the 8 symmetric images, so that the keys of all images are updated with a single XOR.
+SYMMETRIC_BLACK = _symmetric_table(ZOBRIST_BLACK)
+SYMMETRIC_WHITE = _symmetric_table(ZOBRIST_WHITE)
+SYMMETRIC_FLIP = _symmetric_table(ZOBRIST_FLIP)
+SYMMETRIC_WHITE_PLAYING = sum(ZOBRIST_WHITE_PLAYING << (64 * symmetry) for symmetry in range(8))
+_EIGHT_KEYS = struct.Struct("<8Q")
+
+
+def symmetric_keys(black, white, playing=None):
+    """
+    Function that calculates the packed Zobrist keys of the 8 symmetric images of a position from scratch.
+
+    :param black: Bitboard of the black pieces.
+    :type black: int
+    :param white: Bitboard of the white pieces.
+    :type white: int
+    :param playing: Player on the move, or None if the keys should not depend on it.
+    :type playing: tuple[int, int, int] or NoneType
+
+    :return: Packed keys, with the key of the image under symmetry s in bits 64 * s to 64 * s + 63.
+    :rtype: int
+    """
+
+    keys = 0
+    for index in squares(black):
+        keys ^= SYMMETRIC_BLACK[index]
+    for index in squares(white):
+        keys ^= SYMMETRIC_WHITE[index]
+    if playing == WHITE:
+        keys ^= SYMMETRIC_WHITE_PLAYING
+    return keys
+
+
+def smallest_key(keys):
+    """
+    Function that finds the smallest of the packed keys of the 8 symmetric images of a position.
+
+    :param keys: Packed keys.
+    :type keys: int
+
+    :return: Smallest key and the first symmetry with that key.
+    :rtype: tuple[int, int]
+    """
+
+    keys = _EIGHT_KEYS.unpack(keys.to_bytes(64, "little"))
+    best_key = min(keys)
+    return best_key, keys.index(best_key)
+
+
+def canonical_key(black, white, playing=None):
+    """
+    Function that calculates the canonical key of a position: the smallest Zobrist key of the 8 symmetric images of
+    the position. All symmetric positions have the same canonical key.
+
+    :param black: Bitboard of the black pieces.
+    :type black: int
+    :param white: Bitboard of the white pieces.
+    :type white: int
+    :param playing: Player on the move, or None if the key should not depend on it.
+    :type playing: tuple[int, int, int] or NoneType
+
+    :return: Canonical key and the symmetry that transforms the position into the image with that key.
+    :rtype: tuple[int, int]
+    """
+
+    return smallest_key(symmetric_keys(black, white, playing))
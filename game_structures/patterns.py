@@ -0,0 +1,103 @@
+"""
+Module with the geometry of the patterns used by the pattern evaluation.
+
+A pattern is a group of fields (an edge, a corner region, a line or a diagonal). Every pattern appears on the board in
+several instances, one for each symmetric position of the group, and every instance is described by a ternary index:
+the field at position i of the instance contributes 3 ** i times 0 (empty), 1 (black) or 2 (white). The Board keeps the
+indices of all instances up to date on every move.
+"""
+
+from constants import *
+
+EMPTY_DIGIT = 0
+BLACK_DIGIT = 1
+WHITE_DIGIT = 2
+
+
+def _symmetries(row, column):
+    """
+    Helper function that maps a field to all eight symmetric positions on the board.
+
+    :param row: Row.
+    :type row: int
+    :param column: Column.
+    :type column: int
+
+    :return: Symmetric positions of the field.
+    :rtype: tuple
+    """
+
+    last = ROWS - 1
+    return ((row, column), (row, last - column), (last - row, column), (last - row, last - column),
+            (column, row), (column, last - row), (last - column, row), (last - column, last - row))
+
+
+def _instances(fields):
+    """
+    Helper function that finds all distinct instances of a pattern on the board.
+
+    :param fields: Fields of the pattern in its base position.
+    :type fields: list
+
+    :return: Indices of the bits of the fields of every instance, in the order of the base position.
+    :rtype: tuple
+    """
+
+    instances = []
+    seen = set()
+    for symmetry in range(8):
+        squares = tuple(row * COLUMNS + column for row, column in (_symmetries(*field)[symmetry] for field in fields))
+        if frozenset(squares) not in seen:
+            seen.add(frozenset(squares))
+            instances.append(squares)
+    return tuple(instances)
+
+
+# Base positions of the patterns.
+PATTERNS = (
+    ("edge", [(0, column) for column in range(COLUMNS)]),
+    ("corner", [(row, column) for row in range(3) for column in range(3)]),
+    ("line2", [(1, column) for column in range(COLUMNS)]),
+    ("line3", [(2, column) for column in range(COLUMNS)]),
+    ("line4", [(3, column) for column in range(COLUMNS)]),
+    ("diagonal8", [(i, i) for i in range(8)]),
+    ("diagonal7", [(i, i + 1) for i in range(7)]),
+    ("diagonal6", [(i, i + 2) for i in range(6)]),
+    ("diagonal5", [(i, i + 3) for i in range(5)]),
+    ("diagonal4", [(i, i + 4) for i in range(4)]),
+)
+
+PATTERN_INSTANCES = tuple(_instances(fields) for _, fields in PATTERNS)
+# Flat list of all instances, the pattern each of them belongs to, and (instance, 3 ** position) for every field.
+INSTANCES = tuple(instance for instances in PATTERN_INSTANCES for instance in instances)
+INSTANCE_PATTERNS = tuple(pattern for pattern, instances in enumerate(PATTERN_INSTANCES) for _ in instances)
+SQUARE_INSTANCES = tuple(
+    tuple((instance, 3 ** instance_squares.index(square))
+          for instance, instance_squares in enumerate(INSTANCES) if square in instance_squares)
+    for square in range(ROWS * COLUMNS))
+
+
+def pattern_indices(black, white):
+    """
+    Function that calculates the ternary indices of all instances from scratch.
+
+    :param black: Bitboard of the black pieces.
+    :type black: int
+    :param white: Bitboard of the white pieces.
+    :type white: int
+
+    :return: Index of every instance.
+    :rtype: list
+    """
+
+    indices = []
+    for squares in INSTANCES:
+        index = 0
+        for square in reversed(squares):
+            index *= 3
+            if black >> square & 1:
+                index += BLACK_DIGIT
+            elif white >> square & 1:
+                index += WHITE_DIGIT
+        indices.append(index)
+    return indices
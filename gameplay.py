@@ -3,47 +3,67 @@ Module with basic game flow functions.
 """
 
 from bot_logic.bot import *
+from bot_logic.ponder import *
+from bot_logic.worker import *
 from time import time
+from traceback import print_exception
 
 
-def play_player(game, hash_map, game_tree, player, row=None, column=None, start=None):
+def play_player(game, hash_map, game_tree, player, row=None, column=None, start=None, ponderer=None, depth=None):
     """
     Helper function for determining a player's move.
 
     :param game: Game instance.
     :type game: Game
-    :param hash_map: Hash map.
-    :type hash_map: data_structures.HashMap.HashMap
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable
     :param game_tree: Game tree.
     :type game_tree: data_structures.GameTree.Tree
     :param player: Current player.
     :type player: tuple[int, int, int]
-    :param row: Chosen row (for the black player).
+    :param row: Chosen row (for the black player, or for the white player if its move was already searched; None if
+                the search found no move).
     :type row: int or NoneType
-    :param column: Chosen column (for the black player).
+    :param column: Chosen column (for the black player, or for the white player if its move was already searched; None
+                   if the search found no move).
     :type column: int or NoneType
     :param start: Start time of the move.
     :type start: float or NoneType
+    :param ponderer: Ponderer that searches on the black player's time, if pondering is enabled.
+    :type ponderer: bot_logic.ponder.Ponderer or NoneType
+    :param depth: Depth of the search of the white player's move, if it was already searched.
+    :type depth: int or NoneType
 
     :return: End time of the move and whether the move was successful.
     :rtype: tuple[float, bool]
     """
 
     if player == WHITE:
-        row, col, depth = bot_play(game.board, hash_map, game_tree.current)
+        if row is None and depth is None:
+            evaluation_cache = None
+            if ponderer is not None:
+                ponderer.stop()
+                evaluation_cache = ponderer.evaluation_cache
+            row, column, depth = bot_play(game.board, hash_map, game_tree.current, evaluation_cache=evaluation_cache)
+        if row is None:
+            return time(), False
         elapsed_time = time() - start
-        moved = game.play(row, col, depth, elapsed_time)
+        moved = game.play(row, column, depth, elapsed_time)
     else:
+        if ponderer is not None and (row, column) in game.board.legal_moves:
+            ponderer.stop()
         moved = game.play(row, column)
     if moved:
         for current_child in game_tree.current.children:
-            if game.board == current_child.data:
+            if game.board.signature == current_child.data:
                 game_tree.current = current_child
                 break
         else:
-            new_node = TreeNode(deepcopy(game.board))
+            new_node = TreeNode(game.board.signature)
             game_tree.current.add_child(new_node)
             game_tree.current = new_node
+        if player == WHITE and ponderer is not None and game.game_on():
+            ponderer.start(game.board, game_tree.current)
     return time(), moved
 
 
@@ -53,12 +73,15 @@ def play_console(game, hash_map, game_tree):
 
     :param game: Game instance.
     :type game: Game
-    :param hash_map: Hash map.
-    :type hash_map: HashMap
+    :param hash_map: Search table.
+    :type hash_map: TranspositionTable
     :param game_tree: Game tree.
     :type game_tree: Tree
     """
 
+    ponderer = None
+    if PONDER:
+        ponderer = Ponderer(hash_map)
     start = time()
     while game.game_on():
         if game.turn == BLACK:
@@ -73,9 +96,11 @@ def play_console(game, hash_map, game_tree):
                 except Exception:
                     continue
             row, column = moves[my_move]
-            start, moved = play_player(game, hash_map, game_tree, BLACK, row, column, None)
+            start, moved = play_player(game, hash_map, game_tree, BLACK, row, column, None, ponderer)
         if game.turn == WHITE:
-            play_player(game, hash_map, game_tree, WHITE, None, None, start)
+            play_player(game, hash_map, game_tree, WHITE, None, None, start, ponderer)
+    if ponderer is not None:
+        ponderer.stop()
     winner = game.winner()
     if winner != "TIE":
         print(f"Game over! {winner} WON!")
@@ -89,8 +114,8 @@ def play_gui(game, hash_map, window, fps, font, game_tree):
 
     :param game: Game instance.
     :type game: Game
-    :param hash_map: Hash map.
-    :type hash_map: data_structures.HashMap.HashMap
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable
     :param window: Window in which the game is displayed.
     :type window: pygame.Surface
     :param fps: Frames per second.
@@ -101,6 +126,12 @@ def play_gui(game, hash_map, window, fps, font, game_tree):
     :type game_tree: Tree
     """
 
+    ponderer = None
+    evaluation_cache = None
+    if PONDER:
+        ponderer = Ponderer(hash_map)
+        evaluation_cache = ponderer.evaluation_cache
+    worker = BotWorker()
     clock = pygame.time.Clock()
     start = time()
     run = True
@@ -112,12 +143,13 @@ def play_gui(game, hash_map, window, fps, font, game_tree):
         window.blit(text, textbox)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                worker.cancel()
                 run = False
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if game.turn == BLACK:
                     position = pygame.mouse.get_pos()
                     row, column = mouse_action(position)
-                    end, moved = play_player(game, hash_map, game_tree, BLACK, row, column, None)
+                    end, moved = play_player(game, hash_map, game_tree, BLACK, row, column, None, ponderer)
                     if moved:
                         elapsed_time = end - start
                         text, textbox = nortifications(window, font, game.black, game.white, "black", elapsed_time)
@@ -134,17 +166,31 @@ def play_gui(game, hash_map, window, fps, font, game_tree):
                                     f"White: {game.white}                          "
                                     f"Game over!      "
                                     f"{winner_text}                  ", True, BLACK, WHITE), textbox)
+        if run and game.turn == WHITE:
+            if not worker.running:
+                if ponderer is not None:
+                    ponderer.stop()
+                worker.start(game.board, hash_map, game_tree.current, evaluation_cache)
+            result = worker.poll()
+            if result is None:
+                thinking_text, thinking_box = thinking_notification(window, font, time() - worker.start_time)
+                window.blit(thinking_text, thinking_box)
+            elif worker.error is not None:
+                print_exception(worker.error)
+                run = False
+            else:
+                row, column, depth = result
+                start = worker.start_time
+                end, moved = play_player(game, hash_map, game_tree, WHITE, row, column, start, ponderer, depth)
+                if moved:
+                    elapsed_time = end - start
+                    text, textbox = nortifications(window, font, game.black, game.white, "white", elapsed_time)
+                    game.update()
+                    window.blit(text, textbox)
+                    start = end
         pygame.display.update()
-        if game.turn == WHITE:
-            start = time()
-            end, moved = play_player(game, hash_map, game_tree, WHITE, None, None, start)
-            if moved:
-                elapsed_time = end - start
-                text, textbox = nortifications(window, font, game.black, game.white, "white", elapsed_time)
-                game.update()
-                window.blit(text, textbox)
-                start = end
-        pygame.display.update()
+    if ponderer is not None:
+        ponderer.stop()
     print(f"{winner} WON!")
     pygame.quit()
 
@@ -157,8 +203,8 @@ def main_gui(mode, game, hash_map, window, game_tree):
     :type mode: int
     :param game: Game instance.
     :type game: Game
-    :param hash_map: Hash map.
-    :type hash_map: data_structures.HashMap.HashMap
+    :param hash_map: Search table.
+    :type hash_map: data_structures.TranspositionTable.TranspositionTable
     :param window: Window in which the game is displayed.
     :type window: pygame.Surface
     :param game_tree: Game tree.
@@ -205,6 +251,29 @@ def nortifications(window, font=None, black=2, white=2, last_played="", elapsed_
     return text, textbox
 
 
+def thinking_notification(window, font, elapsed_time):
+    """
+    Helper function for displaying the notification while the bot is searching its move in GUI mode.
+
+    :param window: Window in which the game is displayed.
+    :type window: pygame.Surface
+    :param font: Text font in the window.
+    :type font: pygame.font.Font
+    :param elapsed_time: Time since the bot started searching.
+    :type elapsed_time: float
+
+    :return: Text and text box area to be displayed in the window.
+    :rtype: tuple[pygame.Surface, pygame.Rect]
+    """
+
+    pygame.draw.rect(window, WHITE, pygame.Rect(0, 700, 700, 30))
+    dots = "." * (int(elapsed_time * 2) % 3 + 1)
+    text = font.render(f'White is thinking{dots:<3}   {elapsed_time: .1f} s', True, BLACK, WHITE)
+    textbox = text.get_rect()
+    textbox.center = (700 // 2, 715)
+    return text, textbox
+
+
 def mouse_action(position):
     """
     Helper function for calculating the selected field's coordinates in GUI mode based on mouse action.
@@ -9,7 +9,12 @@ __project__ = "Othello/Reversi Game"
 
 from gameplay import *
 from data_structures.HashMap import *
+from data_structures.TranspositionTable import *
 from data_structures.GameTree import *
+from os import makedirs, path
+
+# The search table is kept in the home directory of the user rather than next to the source.
+TABLE_FILE = path.join(path.expanduser("~"), ".othello", "table.bin")
 
 
 def select_mode():
@@ -32,21 +37,44 @@ def init_game():
     Function to initialize the basic structures used during the game.
 
     :return: Structures and data needed for the game continuation.
-    :rtype: tuple[Game, HashMap, Tree, int]
+    :rtype: tuple[Game, TranspositionTable, Tree, int]
     """
 
     mode = select_mode()
+    set_evaluator(EVALUATOR)
+    if OPENING_BOOK and path.exists(BOOK_FILE):
+        set_opening_book(BOOK_FILE)
     game = Game(mode)
-    hash_map = HashMap()
-    game_root = TreeNode(deepcopy(game.board))
+    hash_map = load_table()
+    game_root = TreeNode(game.board.signature)
     game_tree = Tree(game_root)
     for row, col in game.board.legal_moves:
-        tmp_board = deepcopy(game.board)
-        tmp_board.insert(row, col, BLACK)
-        game_root.add_child(TreeNode(tmp_board))
+        record = game.board.make_move(row, col, BLACK)
+        game_root.add_child(TreeNode(game.board.signature))
+        game.board.unmake_move(record)
     return game, hash_map, game_tree, mode
 
 
+def load_table():
+    """
+    Function that loads the search table saved by the previous game, or creates a new one if there is no usable saved
+    table. A saved table is only usable if it was searched with the same evaluation and the same kind of keys.
+
+    :return: Search table.
+    :rtype: TranspositionTable
+    """
+
+    if PERSISTENT_TABLE and path.exists(TABLE_FILE):
+        try:
+            hash_map = load_transposition_table(TABLE_FILE, memory_map=True, fingerprint=evaluator_fingerprint())
+        except ValueError:
+            pass
+        else:
+            if hash_map.symmetric == SYMMETRIC_TABLE:
+                return hash_map
+    return TranspositionTable(symmetric=SYMMETRIC_TABLE, fingerprint=evaluator_fingerprint())
+
+
 def begin():
     """
     Function to initialize the game.
@@ -63,6 +91,9 @@ def begin():
         WINDOW = pygame.display.set_mode((WIDTH, HEIGHT))
         game.window = WINDOW
         main_gui(mode, game, hash_map, WINDOW, game_tree)
+    if PERSISTENT_TABLE:
+        makedirs(path.dirname(TABLE_FILE), exist_ok=True)
+        hash_map.save(TABLE_FILE)
 
 
 if __name__ == '__main__':
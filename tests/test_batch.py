@@ -0,0 +1,53 @@
+"""
+Tests of the batched NumPy evaluation, compared with the evaluation of one position at a time.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from bot_logic.search import *
+from random import Random
+
+
+def boards(count, seed=0):
+    random = Random(seed)
+    result = []
+    for _ in range(count):
+        board = Board(1)
+        while board.legal_moves:
+            result.append(board.copy())
+            board.make_move(*random.choice(board.legal_moves), board.playing)
+        result.append(board.copy())
+    return result
+
+
+def test_batch_heuristics_match_scalar():
+    positions = boards(10)
+    fields = stack_boards(positions)
+    for color in (BLACK, WHITE):
+        values = batch_heuristics_score(fields, color).tolist()
+        assert values == pytest.approx([heuristics_score(board, color) for board in positions])
+
+
+def test_children_match_scalar_evaluation():
+    for board in boards(3, 1):
+        if not board.legal_moves:
+            continue
+        values = evaluate_children(board, board.legal_moves, SearchContext(inf))
+        for (row, column), value in zip(board.legal_moves, values):
+            record = board.make_move(row, column, board.playing)
+            assert value == pytest.approx(evaluate(board)[0])
+            board.unmake_move(record)
+
+
+def test_no_children():
+    assert evaluate_children(Board(1), [], SearchContext(inf)) == []
+
+
+def test_batched_search_matches_serial():
+    board = boards(1, 2)[20]
+    serial = negamax(board, 4, TranspositionTable(1), TreeNode(None), SearchContext(inf, False))
+    batched = negamax(board, 4, TranspositionTable(1), TreeNode(None), SearchContext(inf, True))
+    assert batched[0] == pytest.approx(serial[0])
+    assert batched[1] == serial[1]
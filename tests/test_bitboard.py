@@ -0,0 +1,82 @@
+"""
+Tests of the bitboard helper functions, compared with a direct scan of the board.
+"""
+
+from game_structures import bitboard
+from constants import *
+from random import Random
+
+DIRECTIONS = [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1) if x or y]
+
+
+def naive_flips(row, column, player, opponent):
+    flipped = 0
+    for x, y in DIRECTIONS:
+        line = 0
+        current_row, current_column = row + x, column + y
+        while 0 <= current_row < ROWS and 0 <= current_column < COLUMNS \
+                and opponent >> bitboard.square(current_row, current_column) & 1:
+            line |= 1 << bitboard.square(current_row, current_column)
+            current_row, current_column = current_row + x, current_column + y
+        if 0 <= current_row < ROWS and 0 <= current_column < COLUMNS \
+                and player >> bitboard.square(current_row, current_column) & 1:
+            flipped |= line
+    return flipped
+
+
+def naive_legal_moves(player, opponent):
+    moves = 0
+    for index in range(ROWS * COLUMNS):
+        if not (player | opponent) >> index & 1 and naive_flips(*bitboard.position(index), player, opponent):
+            moves |= 1 << index
+    return moves
+
+
+def random_positions(count, seed=0):
+    random = Random(seed)
+    for _ in range(count):
+        player = opponent = 0
+        for index in range(ROWS * COLUMNS):
+            field = random.random()
+            if field < 0.35:
+                player |= 1 << index
+            elif field < 0.7:
+                opponent |= 1 << index
+        yield player, opponent
+
+
+def test_square_and_position():
+    for row in range(ROWS):
+        for column in range(COLUMNS):
+            assert bitboard.position(bitboard.square(row, column)) == (row, column)
+
+
+def test_popcount_and_squares():
+    for player, opponent in random_positions(20):
+        indices = list(bitboard.squares(player))
+        assert indices == sorted(index for index in range(ROWS * COLUMNS) if player >> index & 1)
+        assert bitboard.popcount(player) == len(indices)
+
+
+def test_initial_legal_moves():
+    moves = bitboard.legal_moves(bitboard.INITIAL_BLACK, bitboard.INITIAL_WHITE)
+    assert [bitboard.position(index) for index in bitboard.squares(moves)] == [(2, 3), (3, 2), (4, 5), (5, 4)]
+
+
+def test_legal_moves_match_naive_scan():
+    for player, opponent in random_positions(200):
+        assert bitboard.legal_moves(player, opponent) == naive_legal_moves(player, opponent)
+
+
+def test_flips_match_naive_scan():
+    for player, opponent in random_positions(100, 1):
+        for index in bitboard.squares(bitboard.legal_moves(player, opponent)):
+            assert bitboard.flips(1 << index, player, opponent) == naive_flips(*bitboard.position(index), player,
+                                                                             opponent)
+
+
+def test_moves_do_not_wrap_around_edges():
+    player = 1 << bitboard.square(3, 7)
+    opponent = 1 << bitboard.square(4, 0)
+    assert bitboard.legal_moves(player, opponent) == 0
+    assert bitboard.flips(1 << bitboard.square(5, 1), player, opponent) == 0
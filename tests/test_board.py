@@ -0,0 +1,138 @@
+"""
+Tests of the Board class.
+"""
+
+from game_structures.Board import *
+from random import Random
+import pytest
+
+
+def snapshot(board):
+    return (board.black_bits, board.white_bits, board.black, board.white, board.playing, board.legal_bits,
+            list(board.legal_moves), board.future_legal_moves, board.hash_key, board.symmetric_keys,
+            board.black_weight, board.white_weight, board.black_frontier, board.white_frontier, list(board.patterns))
+
+
+def random_games(count, seed=0):
+    """
+    Generator of the boards of random games, after every move.
+    """
+
+    random = Random(seed)
+    for _ in range(count):
+        board = Board(1)
+        while board.legal_moves:
+            board.make_move(*random.choice(board.legal_moves), board.playing)
+            yield board
+
+
+def test_make_move_flips_pieces():
+    board = Board(1)
+    record = board.make_move(2, 3, BLACK)
+    assert record is not None
+    assert board.black_bits == bitboard.INITIAL_BLACK | 1 << bitboard.square(2, 3) | 1 << bitboard.square(3, 3)
+    assert board.white_bits == 1 << bitboard.square(4, 4)
+    assert (board.black, board.white, board.playing) == (4, 1, WHITE)
+    assert board.legal_moves == [(2, 2), (2, 4), (4, 2)]
+
+
+def test_illegal_move_is_not_played():
+    board = Board(1)
+    before = snapshot(board)
+    assert board.make_move(0, 0, BLACK) is None
+    assert board.make_move(3, 3, BLACK) is None
+    assert board.make_move(8, 0, BLACK) is None
+    assert not board.insert(2, 2, BLACK)
+    assert snapshot(board) == before
+
+
+def test_unmake_move_restores_board():
+    random = Random(1)
+    for board in random_games(20):
+        if not board.legal_moves:
+            continue
+        before = snapshot(board)
+        records = []
+        for _ in range(3):
+            if not board.legal_moves:
+                break
+            records.append(board.make_move(*random.choice(board.legal_moves), board.playing))
+        for record in reversed(records):
+            board.unmake_move(record)
+        assert snapshot(board) == before
+
+
+def test_incremental_zobrist_key():
+    for board in random_games(20, 2):
+        assert board.hash_key == bitboard.zobrist_key(board.black_bits, board.white_bits, board.playing)
+
+
+def test_zobrist_key_depends_on_player():
+    board = Board(1)
+    assert board.hash_key != bitboard.zobrist_key(board.black_bits, board.white_bits, WHITE)
+    assert bitboard.zobrist_key(board.black_bits, board.white_bits, WHITE) ^ board.hash_key \
+        == bitboard.ZOBRIST_WHITE_PLAYING
+
+
+def test_mobility_counts_both_players():
+    for board in random_games(10, 3):
+        own, other = board.mobility()
+        assert own == len(board.legal_moves)
+        opponent = BLACK if board.playing == WHITE else WHITE
+        assert other == len(Board.from_bits(board.black_bits, board.white_bits, opponent).legal_moves)
+
+
+def test_incremental_evaluation_terms():
+    for board in random_games(20, 4):
+        fresh = Board.from_bits(board.black_bits, board.white_bits, board.playing)
+        assert (board.black_weight, board.white_weight) == (fresh.black_weight, fresh.white_weight)
+        assert (board.black_frontier, board.white_frontier) == (fresh.black_frontier, fresh.white_frontier)
+
+
+def test_evaluation_terms_of_initial_position():
+    board = Board(1)
+    assert board.black_weight == board.white_weight == 2 * SQUARE_WEIGHTS[3][3]
+    assert board.black_frontier == board.white_frontier == 10
+
+
+def test_incremental_pattern_indices():
+    for board in random_games(20, 5):
+        assert board.patterns == patterns.pattern_indices(board.black_bits, board.white_bits)
+
+
+def test_pattern_indices_are_ternary_numbers():
+    for board in random_games(3, 6):
+        for squares, index in zip(patterns.INSTANCES, board.patterns):
+            digits = [patterns.BLACK_DIGIT if board.black_bits >> square & 1 else
+                      patterns.WHITE_DIGIT if board.white_bits >> square & 1 else patterns.EMPTY_DIGIT
+                      for square in squares]
+            assert index == sum(digit * 3 ** position for position, digit in enumerate(digits))
+
+
+def test_copy_is_independent():
+    board = Board(1)
+    board.make_move(2, 3, BLACK)
+    copy = board.copy()
+    assert snapshot(copy) == snapshot(board)
+    before = snapshot(board)
+    copy.make_move(*copy.legal_moves[0], WHITE)
+    assert snapshot(board) == before
+    assert copy.signature != board.signature
+
+
+def test_from_string():
+    initial = "-" * 27 + "OX" + "-" * 6 + "XO" + "-" * 27
+    board = Board.from_string(initial)
+    assert snapshot(board) == snapshot(Board(1))
+    board = Board.from_string("\n".join(initial[row * COLUMNS:(row + 1) * COLUMNS] for row in range(ROWS)) + " O")
+    assert board.playing == WHITE
+    assert board.hash_key == bitboard.zobrist_key(board.black_bits, board.white_bits, WHITE)
+
+
+def test_invalid_positions_are_rejected():
+    for string in ("-" * 63, "-" * 63 + "?", "-" * 64 + "?"):
+        with pytest.raises(ValueError):
+            Board.from_string(string)
+    for black, white in ((1, 1), (1 << 64, 0), (-1, 0)):
+        with pytest.raises(ValueError):
+            Board.from_bits(black, white)
@@ -0,0 +1,72 @@
+"""
+Tests of the bot's move selection.
+"""
+
+from bot_logic.bot import *
+from bot_logic.cooperative import *
+
+
+def no_moves_board():
+    """
+    Position in which the white player is on the move but has no legal moves.
+    """
+
+    return Board.from_bits(0b11, 1 << 63, WHITE)
+
+
+def test_bot_play_without_legal_moves():
+    board = no_moves_board()
+    assert board.legal_moves == []
+    assert bot_play(board, TranspositionTable(1), TreeNode(None), 0.1) == (None, None, 0)
+
+
+def test_cooperative_play_without_legal_moves():
+    search = cooperative_play(no_moves_board(), TranspositionTable(1), TreeNode(None), 0.1)
+    try:
+        next(search)
+    except StopIteration as result:
+        assert result.value == (None, None, 0)
+    else:
+        raise AssertionError("Search without legal moves should not yield !")
+
+
+def test_bot_play_returns_legal_move():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    row, column, depth = bot_play(board, TranspositionTable(1), TreeNode(None), 0.2)
+    assert (row, column) in board.legal_moves
+    assert depth >= 1
+
+
+def test_minimax_steps_matches_minimax():
+    board = Board(1)
+    for ply in range(5):
+        board.make_move(*board.legal_moves[ply % len(board.legal_moves)], board.playing)
+    for depth in range(1, 4):
+        expected = minimax(board, depth, TranspositionTable(1), TreeNode(None), SearchContext(inf), board.playing)
+        search = minimax_steps(board, depth, TranspositionTable(1), TreeNode(None), SearchContext(inf),
+                               board.playing, slice_nodes=8)
+        slices = 0
+        try:
+            while True:
+                next(search)
+                slices += 1
+        except StopIteration as result:
+            assert result.value == expected
+        assert slices > 0 or depth == 1
+
+
+def test_cooperative_play_yields_and_returns_legal_move():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    search = cooperative_play(board, TranspositionTable(1), TreeNode(None), 0.3, 16)
+    yielded = 0
+    try:
+        while True:
+            next(search)
+            yielded += 1
+    except StopIteration as result:
+        row, column, depth = result.value
+    assert yielded > 0
+    assert (row, column) in board.legal_moves
+    assert depth >= 1
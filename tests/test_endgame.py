@@ -0,0 +1,70 @@
+"""
+Tests of the exact endgame solver and of the bot's moves near the end of the game.
+"""
+
+from bot_logic import bot
+from bot_logic.bot import *
+from random import Random
+
+
+def endgame_board(empty_fields, seed=0):
+    """
+    Position reached by random moves from the initial position, with the given (odd) number of empty fields and the
+    white player on the move.
+    """
+
+    random = Random(seed)
+    while True:
+        board = Board(1)
+        while ROWS * COLUMNS - board.black - board.white > empty_fields and board.legal_moves:
+            board.make_move(*random.choice(board.legal_moves), board.playing)
+        if ROWS * COLUMNS - board.black - board.white == empty_fields and board.playing == WHITE \
+                and board.legal_moves:
+            return board
+
+
+def brute_force(player, opponent):
+    """
+    Final difference in pieces with perfect play, searched without pruning or move ordering.
+    """
+
+    moves = bitboard.legal_moves(player, opponent)
+    if not moves:
+        return bitboard.popcount(player) - bitboard.popcount(opponent)
+    best_value = -ROWS * COLUMNS
+    for index in bitboard.squares(moves):
+        move = 1 << index
+        flipped = bitboard.flips(move, player, opponent)
+        best_value = max(best_value, -brute_force(opponent ^ flipped, player | move | flipped))
+    return best_value
+
+
+def test_exact_score_matches_brute_force():
+    for seed in range(4):
+        board = endgame_board(9, seed)
+        expected = brute_force(board.white_bits, board.black_bits)
+        value, (row, column) = solve_endgame(board, SearchContext(inf), EXACT_SCORE)
+        assert value == expected
+        assert (row, column) in board.legal_moves
+        record = board.make_move(row, column, WHITE)
+        assert -brute_force(board.black_bits, board.white_bits) == expected
+        board.unmake_move(record)
+
+
+def test_win_loss_draw_matches_sign():
+    for seed in range(4):
+        board = endgame_board(9, seed)
+        expected = brute_force(board.white_bits, board.black_bits)
+        outcome = solve_endgame(board, SearchContext(inf), WIN_LOSS_DRAW)[0]
+        assert (outcome > 0) == (expected > 0) and (outcome < 0) == (expected < 0)
+
+
+def test_solver_timeout_falls_back_to_deeper_search(monkeypatch):
+    def timeout(*args):
+        raise SearchTimeout("Search deadline has passed !")
+
+    monkeypatch.setattr(bot, "solve_endgame", timeout)
+    board = endgame_board(11)
+    row, column, depth = bot_play(board, TranspositionTable(1), TreeNode(None), 1.0)
+    assert (row, column) in board.legal_moves
+    assert depth > 1
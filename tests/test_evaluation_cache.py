@@ -0,0 +1,56 @@
+"""
+Tests of the EvaluationCache data structure.
+"""
+
+from data_structures.EvaluationCache import *
+from bot_logic.search import *
+
+
+def test_store_probe_and_counters():
+    cache = EvaluationCache(100)
+    assert cache.capacity == 64
+    assert cache.probe(5) is None
+    cache.store(5, -12.5, 7)
+    assert cache.probe(5) == (-12.5, 7)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    assert 5 in cache and 6 not in cache
+    assert len(cache) == 1
+
+
+def test_newest_value_replaces_slot():
+    cache = EvaluationCache(64)
+    cache.store(5, 1.0, 1)
+    cache.store(5 + 64, 2.0, 2)
+    assert cache.probe(5) is None
+    assert cache.probe(5 + 64) == (2.0, 2)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.probe(5 + 64) is None
+
+
+def test_cached_evaluation_matches_fresh():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    cache = EvaluationCache()
+    first = evaluate(board, cache)
+    assert evaluate(board, cache) == first == evaluate(board)
+    assert cache.hits == 1
+
+
+def test_cache_is_emptied_for_another_evaluation():
+    board = Board(1)
+    cache = EvaluationCache()
+    context = SearchContext(inf, evaluation_cache=cache)
+    static_fingerprint = cache.fingerprint
+    evaluate(board, context.evaluation_cache)
+    SearchContext(inf, evaluation_cache=cache)
+    assert len(cache) == 1
+    set_evaluator(PATTERN_EVALUATOR)
+    try:
+        SearchContext(inf, evaluation_cache=cache)
+        assert len(cache) == 0
+        assert cache.fingerprint != static_fingerprint
+        assert evaluate(board, cache) == evaluate(board)
+    finally:
+        set_evaluator(STATIC_EVALUATOR)
@@ -0,0 +1,57 @@
+"""
+Tests of the game flow helpers.
+"""
+
+from gameplay import *
+import gameplay
+
+
+def new_game():
+    game = Game(1)
+    game_tree = Tree(TreeNode(game.board.signature))
+    return game, game_tree
+
+
+def test_tree_nodes_hold_signatures():
+    game, game_tree = new_game()
+    root = game_tree.current
+    row, column = game.board.legal_moves[0]
+    end, moved = play_player(game, TranspositionTable(1), game_tree, BLACK, row, column)
+    assert moved
+    assert game_tree.current.data == game.board.signature
+    assert game_tree.current in root.children
+    row, column = game.board.legal_moves[0]
+    play_player(game, TranspositionTable(1), game_tree, WHITE, row, column, end, None, 1)
+    assert game_tree.current.data == game.board.signature
+    assert isinstance(game_tree.current.data, int)
+
+
+def test_existing_child_is_reused():
+    game, game_tree = new_game()
+    row, column = game.board.legal_moves[0]
+    record = game.board.make_move(row, column, BLACK)
+    child = TreeNode(game.board.signature)
+    game.board.unmake_move(record)
+    game_tree.current.add_child(child)
+    play_player(game, TranspositionTable(1), game_tree, BLACK, row, column)
+    assert game_tree.current is child
+    assert len(game_tree.root.children) == 1
+
+
+def test_signature_identifies_position():
+    board = Board(1)
+    assert Board.from_bits(board.black_bits, board.white_bits).signature == board.signature
+    assert board.signature != Board.from_bits(board.white_bits, board.black_bits).signature
+
+
+def test_searched_move_without_result_is_not_searched_again(monkeypatch):
+    def unexpected_bot_play(*args, **kwargs):
+        raise AssertionError("bot_play called again")
+
+    monkeypatch.setattr(gameplay, "bot_play", unexpected_bot_play)
+    game, game_tree = new_game()
+    row, column = game.board.legal_moves[0]
+    end, moved = play_player(game, TranspositionTable(1), game_tree, BLACK, row, column)
+    end, moved = play_player(game, TranspositionTable(1), game_tree, WHITE, None, None, end, None, 0)
+    assert not moved
+    assert game.turn == WHITE
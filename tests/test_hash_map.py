@@ -0,0 +1,47 @@
+"""
+Tests of the HashMap data structure.
+"""
+
+from data_structures.HashMap import *
+import pytest
+
+
+def test_items_survive_rehashing():
+    hash_map = HashMap(8)
+    for key in range(1000):
+        hash_map[key * 7919] = key
+    assert len(hash_map) == 1000
+    assert hash_map.capacity > 8
+    assert hash_map.load_factor <= hash_map.max_load_factor
+    for key in range(1000):
+        assert hash_map[key * 7919] == key
+    assert sorted(hash_map) == [key * 7919 for key in range(1000)]
+
+
+def test_overwrite_does_not_grow():
+    hash_map = HashMap(8)
+    for _ in range(3):
+        for key in range(5):
+            hash_map[key] = key
+    assert len(hash_map) == 5
+    assert hash_map.capacity == 8
+
+
+def test_reserve_avoids_rehashing():
+    hash_map = HashMap(8)
+    hash_map.reserve(100)
+    capacity = hash_map.capacity
+    assert 100 <= capacity * hash_map.max_load_factor
+    for key in range(100):
+        hash_map[key] = key
+    assert hash_map.capacity == capacity
+
+
+def test_delete():
+    hash_map = HashMap(8)
+    hash_map[1] = "one"
+    del hash_map[1]
+    assert 1 not in hash_map
+    assert len(hash_map) == 0
+    with pytest.raises(KeyError):
+        hash_map[1]
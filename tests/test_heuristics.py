@@ -0,0 +1,18 @@
+"""
+Tests of the evaluation of positions.
+"""
+
+from bot_logic.heuristics import *
+
+
+def test_fingerprint_depends_on_evaluation():
+    try:
+        set_evaluator(STATIC_EVALUATOR)
+        static = evaluator_fingerprint()
+        set_evaluator(PATTERN_EVALUATOR)
+        pattern = evaluator_fingerprint()
+        set_evaluator(STATIC_EVALUATOR)
+        assert evaluator_fingerprint() == static
+        assert static != pattern
+    finally:
+        set_evaluator()
@@ -0,0 +1,32 @@
+"""
+Tests of the Lazy SMP search.
+"""
+
+from bot_logic.lazy_smp import *
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    yield
+    close_smp_pool()
+
+
+def test_lazy_smp_finds_move_and_fills_shared_table():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    move, depth = lazy_smp(board, TreeNode(None), SearchContext(0.5), 60, 2)
+    assert move in board.legal_moves
+    assert depth >= 1
+    table = get_smp_pool(2)[1]
+    assert table_entry(table, board)[3] in board.legal_moves
+
+
+def test_lazy_smp_stops_helpers_at_max_depth():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    start = time()
+    move, depth = lazy_smp(board, TreeNode(None), SearchContext(30), 2, 3)
+    assert move in board.legal_moves
+    assert depth == 2
+    assert time() - start < 10
@@ -0,0 +1,62 @@
+"""
+Tests of the opening book.
+"""
+
+from bot_logic.opening_book import *
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_book():
+    yield
+    set_opening_book(None)
+
+
+def test_write_and_probe(tmp_path):
+    file_path = str(tmp_path / "book.bin")
+    entries = {key * 1000003: (key % 64, 8, key / 4) for key in range(1, 300)}
+    write_opening_book(entries, file_path)
+    book = OpeningBook(file_path)
+    try:
+        assert len(book) == len(entries)
+        for key, entry in entries.items():
+            assert book.probe(key) == entry
+        assert book.probe(0) is None and 7 not in book
+    finally:
+        book.close()
+
+
+@pytest.mark.parametrize("content", [b"", b"OTBK" + bytes(2), b"XXXX" + bytes(100)])
+def test_bad_file_is_rejected(tmp_path, content):
+    file_path = tmp_path / "book.bin"
+    file_path.write_bytes(content)
+    with pytest.raises(ValueError):
+        OpeningBook(str(file_path))
+
+
+def test_book_move_of_symmetric_positions(tmp_path):
+    board = Board(1)
+    board.make_move(2, 3, BLACK)
+    key, symmetry = board.canonical_key
+    move = bitboard.square(2, 2)
+    file_path = str(tmp_path / "book.bin")
+    write_opening_book({key: (bitboard.transform_square(move, symmetry), 8, 0.0)}, file_path)
+    set_opening_book(file_path)
+    assert book_move(board) == (2, 2, 8)
+    for image_symmetry in range(8):
+        image = Board.from_bits(bitboard.transform(board.black_bits, image_symmetry),
+                                bitboard.transform(board.white_bits, image_symmetry), WHITE)
+        row, column, depth = book_move(image)
+        assert (row, column) == bitboard.position(bitboard.transform_square(move, image_symmetry))
+        assert (row, column) in image.legal_moves
+    assert book_move(Board(1)) is None
+
+
+def test_shipped_book_covers_first_replies():
+    set_opening_book(BOOK_FILE)
+    board = Board(1)
+    for row, column in board.legal_moves:
+        record = board.make_move(row, column, BLACK)
+        entry = book_move(board)
+        assert entry is not None and entry[:2] in board.legal_moves
+        board.unmake_move(record)
@@ -0,0 +1,31 @@
+"""
+Tests of the MoveOrdering class.
+"""
+
+from bot_logic.ordering import *
+
+
+MOVES = [(0, 0), (1, 1), (2, 3), (3, 2), (5, 4)]
+
+
+def test_static_weights_without_history():
+    ordering = MoveOrdering()
+    assert ordering.order(MOVES, 0, WHITE) == sorted(MOVES, key=lambda move: SQUARE_WEIGHTS[move[0]][move[1]],
+                                                     reverse=True)
+
+
+def test_hash_move_then_killers_first():
+    ordering = MoveOrdering()
+    ordering.cutoff((5, 4), 3, WHITE, 2, 1)
+    ordering.cutoff((1, 1), 3, WHITE, 2, 1)
+    assert ordering.order(MOVES, 3, WHITE, (2, 3))[:3] == [(2, 3), (1, 1), (5, 4)]
+    assert ordering.order(MOVES, 4, WHITE)[0] == (0, 0)
+    assert ordering.killer_cutoffs == 0 and ordering.cutoffs == 2
+
+
+def test_history_ranks_other_moves():
+    ordering = MoveOrdering()
+    ordering.cutoff((1, 1), 0, BLACK, 6, 0)
+    assert ordering.order(MOVES, 5, BLACK)[0] == (1, 1)
+    assert ordering.order(MOVES, 5, WHITE)[0] == (0, 0)
+    assert ordering.first_move_cutoff_rate == 1.0
@@ -0,0 +1,68 @@
+"""
+Tests of the parallel root-split search.
+"""
+
+from bot_logic.parallel import *
+from ctypes import c_byte
+from threading import Timer
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    yield
+    close_pool()
+
+
+def midgame_board():
+    board = Board(1)
+    for ply in range(6):
+        board.make_move(*board.legal_moves[ply % len(board.legal_moves)], board.playing)
+    return board
+
+
+def test_parallel_negamax_matches_serial():
+    board = midgame_board()
+    for depth in range(1, 4):
+        serial = negamax(board, depth, TranspositionTable(1), TreeNode(None), SearchContext(inf))
+        parallel = parallel_negamax(board, depth, TranspositionTable(1), SearchContext(inf), 2)
+        assert parallel == serial[:2]
+
+
+def serial_move_values(board, depth):
+    values = {}
+    for move in board.legal_moves:
+        record = board.make_move(*move, board.playing)
+        values[move] = -negamax(board, depth - 1, TranspositionTable(1), TreeNode(None), SearchContext(inf))[0]
+        board.unmake_move(record)
+    return values
+
+
+def test_iterative_deepening_matches_serial_with_same_root_order():
+    board = midgame_board()
+    hash_map = TranspositionTable(1)
+    for ply in range(2):
+        context = SearchContext(inf)
+        for depth in range(1, 6 - ply):
+            hash_move = table_entry(hash_map, board)[3] if depth > 1 else None
+            order = context.ordering.order(board.legal_moves, 0, board.playing, hash_move)
+            values = serial_move_values(board, depth)
+            best_value = max(values.values())
+            value, move = parallel_negamax(board, depth, hash_map, context, 2)
+            assert value == best_value
+            assert move == next(root_move for root_move in order if values[root_move] == best_value)
+        board.make_move(*move, board.playing)
+        reply = negamax(board, 4, TranspositionTable(1), TreeNode(None), SearchContext(inf))[1]
+        board.make_move(*reply, board.playing)
+
+
+def test_stop_reaches_workers():
+    stop = c_byte(0)
+    context = SearchContext(60, stop=stop)
+    timer = Timer(0.5, setattr, (stop, "value", 1))
+    timer.start()
+    start = time()
+    with pytest.raises(SearchTimeout):
+        parallel_negamax(midgame_board(), 20, TranspositionTable(1), context, 2)
+    timer.join()
+    assert time() - start < 5
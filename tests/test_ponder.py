@@ -0,0 +1,48 @@
+"""
+Tests of the Ponderer class.
+"""
+
+from bot_logic.ponder import *
+from time import sleep
+
+
+def test_pondering_fills_table():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    board.make_move(*board.legal_moves[0], WHITE)
+    hash_map = TranspositionTable(1)
+    ponderer = Ponderer(hash_map)
+    ponderer.start(board, TreeNode(board.signature))
+    sleep(0.3)
+    ponderer.stop()
+    assert not ponderer.running
+    assert ponderer.depth >= 1
+    assert ponderer.nodes > 0
+    assert len(hash_map) > 0
+
+
+def test_pondering_leaves_board_unchanged():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    signature = board.signature
+    ponderer = Ponderer(TranspositionTable(1))
+    ponderer.start(board, TreeNode(board.signature))
+    sleep(0.1)
+    ponderer.stop()
+    assert board.signature == signature
+
+
+def test_pondering_hands_over_bounded_subtrees():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    board.make_move(*board.legal_moves[0], WHITE)
+    game_tree = Tree(TreeNode(board.signature))
+    ponderer = Ponderer(TranspositionTable(1))
+    ponderer.start(board, game_tree.current)
+    sleep(0.3)
+    ponderer.stop()
+    assert ponderer.depth > TREE_PLIES
+    replies = game_tree.current.children
+    assert len(replies) == len(board.legal_moves)
+    assert all(reply.children for reply in replies)
+    assert game_tree.height() == TREE_PLIES + 1
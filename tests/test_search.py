@@ -0,0 +1,111 @@
+"""
+Tests of the search algorithms, compared with a plain minimax without pruning or a search table.
+"""
+
+from bot_logic.search import *
+from random import Random
+
+
+def reference(state, depth):
+    """
+    Value of the position from the point of view of the white player, searched without pruning or a search table.
+    """
+
+    if depth == 0 or not state.legal_moves:
+        value = evaluate(state)[0]
+        return value if state.playing == WHITE else -value
+    values = []
+    for row, column in state.legal_moves:
+        record = state.make_move(row, column, state.playing)
+        values.append(reference(state, depth - 1))
+        state.unmake_move(record)
+    if state.playing == WHITE:
+        return max(values)
+    return min(values)
+
+
+def positions(count, seed=0):
+    random = Random(seed)
+    for _ in range(count):
+        board = Board(1)
+        for _ in range(random.randrange(2, 30)):
+            if not board.legal_moves:
+                break
+            board.make_move(*random.choice(board.legal_moves), board.playing)
+        if board.legal_moves:
+            yield board
+
+
+def test_white_point_of_view_is_its_own_inverse():
+    for player in (BLACK, WHITE):
+        for bound in (EXACT, LOWER_BOUND, UPPER_BOUND):
+            assert white_point_of_view(*white_point_of_view(2.5, bound, player), player) == (2.5, bound)
+    assert white_point_of_view(2.5, LOWER_BOUND, BLACK) == (-2.5, UPPER_BOUND)
+    assert white_point_of_view(2.5, EXACT, WHITE) == (2.5, EXACT)
+
+
+def test_deep_entry_is_reused():
+    board = Board(1)
+    hash_map = TranspositionTable(1)
+    hash_map[board.hash_key] = 5, EXACT, 123.0, (2, 3)
+    assert minimax(board, 3, hash_map, TreeNode(None), SearchContext(inf), BLACK)[:2] == (123.0, (2, 3))
+
+
+def test_shallow_entry_is_searched_again():
+    board = Board(1)
+    hash_map = TranspositionTable(1)
+    hash_map[board.hash_key] = 1, EXACT, 123.0, (2, 3)
+    value, move = minimax(board, 2, hash_map, TreeNode(None), SearchContext(inf), BLACK)[:2]
+    assert value != 123.0
+    assert hash_map[board.hash_key] == (2, EXACT, value, move)
+
+
+def test_bound_type_follows_window():
+    board = Board(1)
+    value = minimax(board, 2, TranspositionTable(1), TreeNode(None), SearchContext(inf), BLACK)[0]
+    for alpha, beta, bound in ((value + 1, inf, UPPER_BOUND), (-inf, value - 1, LOWER_BOUND), (-inf, inf, EXACT)):
+        hash_map = TranspositionTable(1)
+        minimax(board, 2, hash_map, TreeNode(None), SearchContext(inf), BLACK, alpha, beta)
+        assert hash_map[board.hash_key][1] == bound
+
+
+def test_minimax_with_shared_table_matches_reference():
+    for board in positions(6):
+        hash_map = TranspositionTable(1)
+        for depth in range(1, 4):
+            value = minimax(board, depth, hash_map, TreeNode(None), SearchContext(inf), board.playing)[0]
+            assert value == reference(board, depth)
+
+
+def test_minimax_window_bounds():
+    for board in positions(4, 1):
+        expected = reference(board, 3)
+        hash_map = TranspositionTable(1)
+        for alpha, beta in ((expected - 50, expected + 50), (expected + 1, expected + 100),
+                            (expected - 100, expected - 1)):
+            value = minimax(board, 3, hash_map, TreeNode(None), SearchContext(inf), board.playing, alpha, beta)[0]
+            if expected <= alpha:
+                assert value <= alpha
+            elif expected >= beta:
+                assert value >= beta
+            else:
+                assert value == expected
+        assert minimax(board, 3, hash_map, TreeNode(None), SearchContext(inf), board.playing)[0] == expected
+
+
+def test_negamax_matches_reference():
+    for board in positions(6, 2):
+        hash_map = TranspositionTable(1)
+        for depth in range(1, 4):
+            value, move = negamax(board, depth, hash_map, TreeNode(None), SearchContext(inf))
+            expected = reference(board, depth)
+            assert value == (expected if board.playing == WHITE else -expected)
+            assert move in board.legal_moves
+
+
+def test_negamax_and_minimax_share_table():
+    for board in positions(4, 3):
+        hash_map = TranspositionTable(1)
+        negamax(board, 3, hash_map, TreeNode(None), SearchContext(inf))
+        value = minimax(board, 3, hash_map, TreeNode(None), SearchContext(inf), board.playing)[0]
+        assert value == reference(board, 3)
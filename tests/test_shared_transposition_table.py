@@ -0,0 +1,40 @@
+"""
+Tests of the SharedTranspositionTable data structure.
+"""
+
+from data_structures.SharedTranspositionTable import *
+import pickle
+import pytest
+
+
+@pytest.fixture
+def table():
+    table = SharedTranspositionTable(1, True)
+    yield table
+    table.close()
+    table.unlink()
+
+
+def test_positional_arguments_match_base_class(table):
+    assert table.symmetric
+    assert len(table.name) > 0
+
+
+def test_pickle_attaches_to_same_memory(table):
+    table.store(12345, 4, EXACT, 1.5, (2, 3))
+    copy = pickle.loads(pickle.dumps(table))
+    try:
+        assert copy.name == table.name
+        assert copy.symmetric
+        assert copy.probe(12345) == (4, EXACT, 1.5, (2, 3))
+        copy.store(54321, 2, LOWER_BOUND, -3.0, None)
+        assert table.probe(54321) == (2, LOWER_BOUND, -3.0, None)
+    finally:
+        copy.close()
+
+
+def test_torn_entry_is_missing(table):
+    table.store(12345, 4, EXACT, 1.5, (2, 3))
+    offset = (12345 & table._mask) * 2 * ENTRY_WORDS
+    table._scores[offset + 1] = 2.5
+    assert table.probe(12345) is None
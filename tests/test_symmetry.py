@@ -0,0 +1,73 @@
+"""
+Tests of the symmetries of the board: canonical keys, moves stored in a symmetric table and the evaluation of
+symmetric positions.
+"""
+
+from bot_logic.search import *
+from random import Random
+import pytest
+
+
+def random_boards(count, seed=0):
+    random = Random(seed)
+    for _ in range(count):
+        board = Board(1)
+        for _ in range(random.randrange(1, 50)):
+            if not board.legal_moves:
+                break
+            board.make_move(*random.choice(board.legal_moves), board.playing)
+        yield board
+
+
+def images(board):
+    for symmetry in range(8):
+        yield symmetry, Board.from_bits(bitboard.transform(board.black_bits, symmetry),
+                                        bitboard.transform(board.white_bits, symmetry), board.playing)
+
+
+def test_inverse_symmetries():
+    for symmetry in range(8):
+        inverse = bitboard.INVERSE_SYMMETRIES[symmetry]
+        for index in range(ROWS * COLUMNS):
+            assert bitboard.transform_square(bitboard.transform_square(index, symmetry), inverse) == index
+            assert bitboard.transform(1 << index, symmetry) == 1 << bitboard.transform_square(index, symmetry)
+
+
+def test_canonical_key_is_shared_by_images():
+    for board in random_boards(50):
+        key, symmetry = board.canonical_key
+        assert (key, symmetry) == bitboard.canonical_key(board.black_bits, board.white_bits, board.playing)
+        assert key == bitboard.zobrist_key(bitboard.transform(board.black_bits, symmetry),
+                                           bitboard.transform(board.white_bits, symmetry), board.playing)
+        for _, image in images(board):
+            assert image.canonical_key[0] == key
+
+
+def test_incremental_symmetric_keys():
+    for board in random_boards(20):
+        assert board.symmetric_keys == bitboard.symmetric_keys(board.black_bits, board.white_bits, board.playing)
+
+
+def test_symmetric_table_moves_are_mapped_back():
+    hash_map = TranspositionTable(1, True)
+    for board in random_boards(30):
+        if not board.legal_moves:
+            continue
+        move = board.legal_moves[-1]
+        store_entry(hash_map, board, 3, EXACT, 1.0, move)
+        index = bitboard.square(*move)
+        for symmetry, image in images(board):
+            image_move = bitboard.position(bitboard.transform_square(index, symmetry))
+            assert table_entry(hash_map, image)[3] == image_move
+
+
+@pytest.mark.parametrize("evaluator", [STATIC_EVALUATOR, PATTERN_EVALUATOR])
+def test_evaluation_is_symmetric(evaluator):
+    set_evaluator(evaluator)
+    try:
+        for board in random_boards(100):
+            value = calculate_heuristics(board)
+            for _, image in images(board):
+                assert calculate_heuristics(image) == pytest.approx(value)
+    finally:
+        set_evaluator()
@@ -0,0 +1,115 @@
+"""
+Tests of the TranspositionTable data structure.
+"""
+
+from data_structures.TranspositionTable import *
+from os import path
+import pytest
+
+
+def filled_table(symmetric=False, fingerprint=0):
+    table = TranspositionTable(1, symmetric, fingerprint=fingerprint)
+    table.new_search()
+    for key in range(1, 200):
+        table.store(key * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF, key % 20, key % 3 + 1, key / 7, divmod(key % 64, 8))
+    return table
+
+
+def entries(table):
+    return [table.probe(key * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF) for key in range(1, 200)]
+
+
+def test_store_and_probe():
+    table = TranspositionTable(1)
+    assert table.probe(7) is None
+    table.store(7, 3, LOWER_BOUND, -2.5, (6, 1))
+    table[8] = (4, EXACT, 0.5, None)
+    assert table.probe(7) == (3, LOWER_BOUND, -2.5, (6, 1))
+    assert table[8] == (4, EXACT, 0.5, None)
+    assert 7 in table and 9 not in table
+    assert len(table) == 2
+    with pytest.raises(KeyError):
+        table[9]
+    table.clear()
+    assert len(table) == 0 and table.probe(7) is None
+
+
+def test_size_is_a_power_of_two_within_budget():
+    table = TranspositionTable(1)
+    assert table.nbytes <= 2 ** 20
+    assert table.capacity & (table.capacity - 1) == 0
+    assert table.nbytes == table.capacity * ENTRY_SIZE
+
+
+def test_replacement_keeps_deep_entries_of_current_search():
+    table = TranspositionTable(1)
+    buckets = table.capacity // 2
+    deep, shallow, newer = 5, 5 + buckets, 5 + 2 * buckets
+    table.new_search()
+    table.store(deep, 10, EXACT, 1.0)
+    table.store(shallow, 2, EXACT, 2.0)
+    assert table.probe(deep) == (10, EXACT, 1.0, None)
+    assert table.probe(shallow) == (2, EXACT, 2.0, None)
+    table.store(newer, 3, EXACT, 3.0)
+    assert table.probe(deep) is not None
+    assert table.probe(shallow) is None
+    assert table.probe(newer) == (3, EXACT, 3.0, None)
+
+
+def test_entries_of_older_searches_are_replaced():
+    table = TranspositionTable(1)
+    buckets = table.capacity // 2
+    table.store(5, 10, EXACT, 1.0)
+    table.new_search()
+    table.store(5 + buckets, 1, EXACT, 2.0)
+    assert table.probe(5) is None
+    assert table.probe(5 + buckets) == (1, EXACT, 2.0, None)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_save_and_load(tmp_path, memory_map):
+    file_path = str(tmp_path / "table.bin")
+    table = filled_table(True, 1234)
+    table.save(file_path)
+    loaded = load_transposition_table(file_path, memory_map, 1234)
+    assert entries(loaded) == entries(table)
+    assert len(loaded) == len(table)
+    assert loaded.generation == table.generation
+    assert loaded.symmetric and loaded.fingerprint == 1234
+    loaded.unmap()
+    assert entries(loaded) == entries(table)
+
+
+def test_mapped_table_can_be_saved_over_its_file(tmp_path):
+    file_path = str(tmp_path / "table.bin")
+    filled_table().save(file_path)
+    loaded = load_transposition_table(file_path, memory_map=True)
+    loaded.store(42, 5, EXACT, 1.0, (3, 4))
+    loaded.save(file_path)
+    assert not path.exists(file_path + ".tmp")
+    assert load_transposition_table(file_path).probe(42) == (5, EXACT, 1.0, (3, 4))
+    assert loaded.probe(42) == (5, EXACT, 1.0, (3, 4))
+
+
+def test_other_fingerprint_is_rejected(tmp_path):
+    file_path = str(tmp_path / "table.bin")
+    filled_table(fingerprint=1).save(file_path)
+    with pytest.raises(ValueError):
+        load_transposition_table(file_path, fingerprint=2)
+    assert load_transposition_table(file_path).fingerprint == 1
+
+
+@pytest.mark.parametrize("content", [b"", b"OTTT", b"XXXX" + bytes(100)])
+def test_bad_file_is_rejected(tmp_path, content):
+    file_path = tmp_path / "table.bin"
+    file_path.write_bytes(content)
+    with pytest.raises(ValueError):
+        load_transposition_table(str(file_path))
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    file_path = tmp_path / "table.bin"
+    filled_table().save(str(file_path))
+    file_path.write_bytes(file_path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        load_transposition_table(str(file_path))
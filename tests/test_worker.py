@@ -0,0 +1,55 @@
+"""
+Tests of the BotWorker class.
+"""
+
+from bot_logic.worker import *
+import bot_logic.worker
+from time import sleep
+
+
+def started_board():
+    board = Board(1)
+    board.make_move(*board.legal_moves[0], BLACK)
+    return board
+
+
+def test_worker_returns_move_without_changing_board():
+    board = started_board()
+    signature = board.signature
+    worker = BotWorker()
+    worker.start(board, TranspositionTable(1), TreeNode(None))
+    assert worker.running
+    result = None
+    while result is None:
+        sleep(0.05)
+        result = worker.poll()
+    row, column, depth = result
+    assert (row, column) in board.legal_moves
+    assert not worker.running
+    assert board.signature == signature
+
+
+def test_cancel_stops_search():
+    worker = BotWorker()
+    worker.start(started_board(), TranspositionTable(1), TreeNode(None))
+    start = time()
+    worker.cancel()
+    assert time() - start < 1
+    assert not worker.running
+    assert worker.poll() is None
+
+
+def test_failed_search_hands_over_no_move(monkeypatch):
+    def failing_bot_play(*args, **kwargs):
+        raise RuntimeError("search failed")
+
+    monkeypatch.setattr(bot_logic.worker, "bot_play", failing_bot_play)
+    worker = BotWorker()
+    worker.start(started_board(), TranspositionTable(1), TreeNode(None))
+    result = None
+    while result is None:
+        sleep(0.05)
+        result = worker.poll()
+    assert result == (None, None, 0)
+    assert isinstance(worker.error, RuntimeError)
+    assert not worker.running